@@ -0,0 +1,100 @@
+import base64
+import os
+import threading
+from collections import OrderedDict
+
+from asset_index import asset_index
+from tracing import traced
+
+# --- ASSET CACHE ---
+# Imported modules survive Streamlit reruns, so a cache living here is shared
+# by every session served from this process. The asset modules warm it with
+# the files inline mode actually embeds. Indexed assets are versioned by
+# their asset index hash, so a lookup never touches the filesystem; only
+# files outside the index are stat'ed for their mtime.
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class AssetCache:
+    """Thread-safe LRU cache of base64 payloads keyed by path and version"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    @traced("asset_cache.get_base64", payload=len)
+    def get_base64(self, file_path):
+        """Return the base64 payload of a file, encoding it only on a miss"""
+        indexed = asset_index.resolve(file_path)
+        if indexed is not None:
+            key, version = indexed.path, indexed.sha1
+        else:
+            key = os.path.normpath(file_path)
+            version = os.stat(key).st_mtime_ns
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(key, "rb") as f:
+            payload = base64.b64encode(f.read()).decode()
+
+        with self._lock:
+            self._store(key, version, payload)
+        return payload
+
+    def _store(self, key, version, payload):
+        """Insert an entry and evict least recently used ones over budget"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old[1])
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = (version, payload)
+        self.bytes += len(payload)
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def warm(self, paths):
+        """Pre-encode the given files, skipping any that are missing"""
+        for path in paths:
+            try:
+                self.get_base64(path)
+            except FileNotFoundError:
+                pass
+        # Warm-up loads are not real traffic
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def clear(self):
+        """Drop every cached payload"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Return hit/miss/byte counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+asset_cache = AssetCache(int(os.environ.get("OYUN_ASSET_CACHE_BYTES", DEFAULT_MAX_BYTES)))
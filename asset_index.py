@@ -0,0 +1,132 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import namedtuple
+
+from scenes import characters, load_scene_store
+
+# --- ASSET INDEX ---
+# One walk over the asset directories at import time records which files
+# exist, their size, content hash and resolved path. Lookups afterwards are
+# dict hits, so a rerun never stats or opens a file just to learn it is
+# missing. Like the asset cache, it lives for the whole process; restart
+# after adding or rebuilding assets.
+
+INDEXED_DIRS = ("sounds", "images", "fonts", "static")
+# get_valid_path used to look here too, for checkouts nested one level down
+NESTED_PREFIX = "oyun"
+CHUNK_SIZE = 64 * 1024
+# Sounds the screens in muhtesem_oyun.py play directly
+UI_SOUNDS = ("sounds/start.mp3", "sounds/decision.mp3", "sounds/dogrukarar.mp3", "sounds/dikkat.mp3")
+# Scene portraits are found by file stem (portraits.portrait_source), so
+# images/gulfem.png is satisfied by images/gulfem.jpg
+IMAGE_DIR = "images"
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+
+AssetEntry = namedtuple("AssetEntry", "path size sha1 mtime_ns")
+
+
+def _sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetIndex:
+    """Snapshot of the asset files on disk, keyed by normalised reference"""
+
+    def __init__(self, entries=None):
+        self._entries = dict(entries or {})
+
+    @classmethod
+    def build(cls, root=".", dirs=INDEXED_DIRS):
+        """Walk the asset directories once and index every file in them"""
+        entries = {}
+        # Nested copies go first so a top-level file of the same name wins
+        for prefix in (NESTED_PREFIX, ""):
+            for directory in dirs:
+                top = os.path.join(root, prefix, directory)
+                for dirpath, _, filenames in os.walk(top):
+                    for name in filenames:
+                        path = os.path.join(dirpath, name)
+                        st = os.stat(path)
+                        ref = os.path.normpath(os.path.relpath(path, os.path.join(root, prefix)))
+                        entries[ref] = AssetEntry(os.path.normpath(path), st.st_size, _sha1(path), st.st_mtime_ns)
+        return cls(entries)
+
+    def resolve(self, ref):
+        """Return the entry for an asset reference, or None if it is missing"""
+        return self._entries.get(os.path.normpath(ref))
+
+    def exists(self, ref):
+        return os.path.normpath(ref) in self._entries
+
+    def resolve_stem(self, ref, suffixes=IMAGE_SUFFIXES):
+        """Return the first indexed reference with ref's directory and stem, or None"""
+        base = os.path.splitext(os.path.normpath(ref))[0]
+        return next((base + suffix for suffix in suffixes if base + suffix in self._entries), None)
+
+    def missing(self, refs):
+        """Return the references that point at no indexed file, sorted"""
+        return sorted({
+            ref for ref in refs
+            if not self.exists(ref) and not (ref.startswith(f"{IMAGE_DIR}/") and self.resolve_stem(ref))
+        })
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {"files": len(self._entries), "bytes": sum(entry.size for entry in self._entries.values())}
+
+
+def referenced_assets(store, extra=()):
+    """Return every asset path the characters and scenes refer to"""
+    refs = set(extra)
+    for char in characters:
+        refs.update((char["img"], char["sound"]))
+    for scene in store.scenes.values():
+        if scene.character and scene.character.get("image"):
+            refs.add(scene.character["image"])
+    return refs
+
+
+_reported = False
+_report_lock = threading.Lock()
+
+
+def report_missing(store, extra=(), index=None):
+    """Print the store's missing asset references to stderr, once per process"""
+    global _reported
+    # Checked before collecting the references, so later reruns cost nothing
+    if _reported:
+        return
+    with _report_lock:
+        if _reported:
+            return
+        _reported = True
+    missing = (index or asset_index).missing(referenced_assets(store, extra))
+    if missing:
+        print(f"asset index: {len(missing)} missing asset reference(s):", file=sys.stderr)
+        for ref in missing:
+            print(f"  {ref}", file=sys.stderr)
+
+
+asset_index = AssetIndex.build()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    missing = asset_index.missing(referenced_assets(load_scene_store(), UI_SOUNDS + tuple(argv)))
+    stats = asset_index.stats()
+    print(f"{stats['files']} assets indexed ({stats['bytes']} bytes), {len(missing)} missing reference(s)")
+    for ref in missing:
+        print(f"  {ref}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
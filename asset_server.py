@@ -0,0 +1,190 @@
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from asset_index import asset_index
+
+# --- STATIC ASSET SERVER ---
+# In "url" mode the <audio> tags reference this server instead of inlining
+# base64 data: URIs, so browsers and proxies fetch each file once and reuse it.
+# OYUN_ASSET_BASE_URL is the address browsers reach it at and must be set.
+# Each app process starts the server itself unless OYUN_ASSET_SERVE=0 says
+# something else (python asset_server.py, a proxy, a CDN) serves the files;
+# if the port cannot be bound the app falls back to inline assets.
+
+ASSET_MODE = os.environ.get("OYUN_ASSET_MODE", "inline")
+ASSET_HOST = os.environ.get("OYUN_ASSET_HOST", "0.0.0.0")
+ASSET_PORT = int(os.environ.get("OYUN_ASSET_PORT", "8502"))
+ASSET_BASE_URL = os.environ.get("OYUN_ASSET_BASE_URL", "").rstrip("/")
+SERVE_ASSETS = os.environ.get("OYUN_ASSET_SERVE", "1") == "1"
+SERVED_DIRS = ("sounds", "images", "fonts", "static")
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)$")
+_etags = {}
+_etags_lock = threading.Lock()
+_server = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+if ASSET_MODE == "url" and not ASSET_BASE_URL:
+    raise ValueError("OYUN_ASSET_MODE=url needs OYUN_ASSET_BASE_URL, the address browsers reach the assets at")
+
+
+def resolve_asset(url_path):
+    """Map a request path to a file inside one of the served directories"""
+    rel = os.path.normpath(unquote(url_path).lstrip("/"))
+    if rel.split(os.sep, 1)[0] not in SERVED_DIRS or not os.path.isfile(rel):
+        return None
+    return rel
+
+
+def file_etag(file_path):
+    """Return a content hash for the file, recomputed only when it changes"""
+    mtime = os.stat(file_path).st_mtime_ns
+    with _etags_lock:
+        cached = _etags.get(file_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    etag = digest.hexdigest()[:16]
+    with _etags_lock:
+        _etags[file_path] = (mtime, etag)
+    return etag
+
+
+def asset_url(file_path):
+    """Return a versioned URL for an asset served by this module"""
+    rel = os.path.normpath(file_path)
+    # Indexed files already carry a hash, so the common case costs no stat
+    entry = asset_index.resolve(rel)
+    version = entry.sha1[:16] if entry else file_etag(rel)
+    return f"{ASSET_BASE_URL}/{rel.replace(os.sep, '/')}?v={version}"
+
+
+def parse_range(header, size):
+    """Parse a single-range Range header into an inclusive (start, end) pair"""
+    match = _RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start == "":
+        length = int(end)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    """Serve game assets with ETags, long-lived caching and range support"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body):
+        file_path = resolve_asset(urlsplit(self.path).path)
+        if file_path is None:
+            self.send_error(404)
+            return
+
+        size = os.path.getsize(file_path)
+        etag = f'"{file_etag(file_path)}"'
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self._send_cache_headers(etag)
+            self.end_headers()
+            return
+
+        start, end = 0, size - 1
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            byte_range = parse_range(range_header, size)
+            if byte_range is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+            status = 206
+
+        self.send_response(status)
+        self._send_cache_headers(etag)
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+
+        if send_body:
+            with open(file_path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    def _send_cache_headers(self, etag):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Access-Control-Allow-Origin", "*")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def ensure_started(host=ASSET_HOST, port=ASSET_PORT):
+    """Start the asset server once per process; return False if it cannot run
+
+    A failed bind is reported once and not retried.
+    """
+    global _server, _server_failed
+    if not SERVE_ASSETS or _server is not None:
+        return True
+    with _server_lock:
+        if _server is None and not _server_failed:
+            try:
+                server = ThreadingHTTPServer((host, port), AssetHandler)
+            except OSError as exc:
+                _server_failed = True
+                print(f"asset server: cannot listen on {host}:{port} ({exc}); serving assets inline", file=sys.stderr)
+                return False
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="asset-server", daemon=True).start()
+            _server = server
+        return _server is not None
+
+
+def url_mode():
+    """Return True if assets are linked by URL rather than inlined"""
+    return ASSET_MODE == "url" and ensure_started()
+
+
+if __name__ == "__main__":
+    print(f"Serving {', '.join(SERVED_DIRS)} on {ASSET_HOST}:{ASSET_PORT}")
+    ThreadingHTTPServer((ASSET_HOST, ASSET_PORT), AssetHandler).serve_forever()
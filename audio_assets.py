@@ -0,0 +1,106 @@
+import json
+import mimetypes
+from functools import lru_cache
+from pathlib import Path
+
+import asset_server
+from asset_cache import asset_cache
+
+# --- AUDIO MANIFEST ---
+# Runtime side of build_audio.py: turns a sounds/... path into the list of
+# (src, type) pairs for an <audio> element's <source> children. In asset url
+# mode every variant is listed smallest first and the browser takes the first
+# one it can play; inline mode embeds only an AAC variant, which every
+# browser decodes: the music's reduced "inline" build when there is one.
+# Without a manifest the original file is used as before.
+# Short effects also live in one sprite; sprite_cue() gives an effect's
+# (start, duration) in it.
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST_PATH = ROOT / "static" / "audio" / "manifest.json"
+SPRITE_PATH = ROOT / "static" / "audio" / "sprite.json"
+INLINE_TYPE = "audio/mp4; codecs=mp4a.40.2"
+
+
+def _load_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    """Return the audio manifest, or an empty dict if it was never built"""
+    return _load_json(MANIFEST_PATH, {})
+
+
+@lru_cache(maxsize=None)
+def load_sprite():
+    """Return the effect sprite's cue sheet, or None if it was never built"""
+    return _load_json(SPRITE_PATH, None)
+
+
+def _data_uri(path, mime):
+    return f"data:{mime.split(';')[0]};base64,{asset_cache.get_base64(path)}"
+
+
+def _candidates(variants, original=None):
+    candidates = [(variant["path"], variant["type"]) for variant in variants]
+    if original is not None:
+        # The original stays last as the fallback for anything else
+        candidates.append((original, mimetypes.guess_type(original)[0] or "audio/mpeg"))
+    return candidates
+
+
+def _inline_source(candidates, inline=None):
+    if inline is not None:
+        return inline["path"], inline["type"]
+    return next(((path, mime) for path, mime in candidates if mime == INLINE_TYPE), candidates[-1])
+
+
+def _sources(variants, original=None, inline=None):
+    candidates = _candidates(variants, original)
+    if asset_server.url_mode():
+        return [(asset_server.asset_url(path), mime) for path, mime in candidates]
+    path, mime = _inline_source(candidates, inline)
+    return [(_data_uri(path, mime), mime)]
+
+
+def inline_paths():
+    """Return the built files inline mode embeds: each sound's and the sprite's"""
+    entries = list(load_manifest().values())
+    sprite = load_sprite()
+    if sprite:
+        entries.append(sprite)
+    return [
+        _inline_source(_candidates(entry["variants"]), entry.get("inline"))[0]
+        for entry in entries if entry["variants"]
+    ]
+
+
+def audio_sources(file_path):
+    """Return (src, type) pairs for a sound; raises FileNotFoundError if missing"""
+    entry = load_manifest().get(Path(file_path).as_posix())
+    if entry is None:
+        return _sources([], file_path)
+    return _sources(entry["variants"], file_path, entry.get("inline"))
+
+
+def sprite_sources():
+    """Return (src, type) pairs for the effect sprite, or [] if it was never built"""
+    sprite = load_sprite()
+    return _sources(sprite["variants"]) if sprite else []
+
+
+def sprite_cue(file_path):
+    """Return the (start, duration) of an effect in the sprite, or None"""
+    sprite = load_sprite()
+    cue = sprite["cues"].get(Path(file_path).as_posix()) if sprite else None
+    return tuple(cue) if cue else None
+
+
+# Inline mode embeds these on every page; encode them once per process
+if asset_server.ASSET_MODE != "url":
+    asset_cache.warm(inline_paths())
@@ -0,0 +1,233 @@
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+from engine import is_finished
+from scenes import load_scene_store
+
+# --- RERUN LATENCY BENCHMARK ---
+# Drives full playthroughs of muhtesem_oyun.py through Streamlit's AppTest
+# harness and records, for every rerun, the wall time, the bytes of
+# markdown/HTML left on the screen, the bytes of every message sent to the
+# browser (including elements discarded by st.rerun()) and the peak Python
+# memory it allocated.
+# Timing and memory come from separate playthroughs because tracemalloc
+# slows the interpreter down. The app's session store and event log write
+# to a throwaway directory, so benchmark runs never reach the real data/.
+
+APP_PATH = Path(__file__).resolve().parent / "muhtesem_oyun.py"
+DEFAULT_REPORT = "bench_report.json"
+CHARACTER_BUTTONS = {"Süleyman": "select_suleyman", "Pargalı": "select_pargali", "Hürrem": "select_hurrem"}
+REGRESSION_THRESHOLD = 0.2
+
+Rerun = namedtuple("Rerun", "screen action wall_ms markdown_bytes wire_bytes elements peak_kib")
+
+
+class WireCounter:
+    """Count the serialized size of every ForwardMsg the app enqueues"""
+
+    def __init__(self):
+        self.bytes = 0
+        self._original = None
+
+    def __enter__(self):
+        original = self._original = ForwardMsgQueue.enqueue
+        counter = self
+
+        def enqueue(queue, msg):
+            counter.bytes += msg.ByteSize()
+            return original(queue, msg)
+
+        ForwardMsgQueue.enqueue = enqueue
+        return self
+
+    def __exit__(self, *exc_info):
+        ForwardMsgQueue.enqueue = self._original
+
+
+_wire = WireCounter()
+
+
+def current_screen(at):
+    """Name the render_* function that produced the last rerun"""
+    screen = at.session_state["current_screen"]
+    if screen == "character_select":
+        return "character_selection"
+    if screen == "loading":
+        return "loading_screen"
+    if is_finished(at.session_state["game_data"]):
+        return "game_end"
+    return "game_screen"
+
+
+def _run(at, action, trace_memory):
+    if trace_memory:
+        tracemalloc.reset_peak()
+    wire_before = _wire.bytes
+    started = time.perf_counter()
+    at.run()
+    wall_ms = (time.perf_counter() - started) * 1000
+    wire_bytes = _wire.bytes - wire_before
+    if at.exception:
+        raise RuntimeError(f"App raised during {action}: {at.exception[0].message}")
+    peak_kib = tracemalloc.get_traced_memory()[1] / 1024 if trace_memory else None
+    markdown_bytes = sum(len(element.value.encode("utf-8")) for element in at.markdown)
+    return Rerun(current_screen(at), action, wall_ms, markdown_bytes, wire_bytes, len(list(at.main)), peak_kib)
+
+
+def isolate_data():
+    """Point the app's on-disk stores at a temporary directory
+
+    Must run before AppTest first imports the app modules, which read the
+    locations from the environment at import time.
+    """
+    data = tempfile.mkdtemp(prefix="oyun-bench-")
+    # The stores flush from atexit hooks registered later, so they run first
+    atexit.register(shutil.rmtree, data, ignore_errors=True)
+    os.environ["OYUN_SESSION_DB"] = os.path.join(data, "sessions.sqlite3")
+    os.environ["OYUN_SESSION_KV_DB"] = os.path.join(data, "session_kv.sqlite3")
+    os.environ["OYUN_EVENT_DIR"] = os.path.join(data, "events")
+    return data
+
+
+def play_through(character, rng, trace_memory=False):
+    """Play one full game through AppTest and return a Rerun per screen"""
+    at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+    reruns = [_run(at, "open", trace_memory)]
+
+    at.button(key=CHARACTER_BUTTONS[character]).click()
+    reruns.append(_run(at, "select_character", trace_memory))
+    at.button(key="confirm_character").click()
+    reruns.append(_run(at, "confirm_character", trace_memory))
+    at.button(key="start_game").click()
+    reruns.append(_run(at, "start_game", trace_memory))
+
+    while True:
+        options = [button for button in at.button if button.key and button.key.startswith("option_")]
+        if not options:
+            break
+        rng.choice(options).click()
+        reruns.append(_run(at, "choose", trace_memory))
+    return reruns
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(reruns, memory_reruns):
+    """Aggregate rerun records per screen"""
+    screens = {}
+    for screen in sorted({rerun.screen for rerun in reruns}):
+        times = [rerun.wall_ms for rerun in reruns if rerun.screen == screen]
+        sizes = [rerun.markdown_bytes for rerun in reruns if rerun.screen == screen]
+        wire = [rerun.wire_bytes for rerun in reruns if rerun.screen == screen]
+        peaks = [rerun.peak_kib for rerun in memory_reruns if rerun.screen == screen]
+        screens[screen] = {
+            "reruns": len(times),
+            "wall_ms_mean": statistics.fmean(times),
+            "wall_ms_p50": _percentile(times, 0.5),
+            "wall_ms_p95": _percentile(times, 0.95),
+            "wall_ms_max": max(times),
+            "markdown_bytes_mean": statistics.fmean(sizes),
+            "markdown_bytes_max": max(sizes),
+            "wire_bytes_mean": statistics.fmean(wire),
+            "wire_bytes_max": max(wire),
+            "peak_kib_max": max(peaks) if peaks else None,
+        }
+    return screens
+
+
+def run_benchmark(playthroughs=3, character="Hürrem", seed=0):
+    """Run timing and memory playthroughs and return the report dict"""
+    isolate_data()
+    rng = random.Random(seed)
+    with _wire:
+        # Warm-up run so imports and caches are not billed to the first screen
+        play_through(character, random.Random(seed))
+
+        reruns = []
+        for _ in range(playthroughs):
+            reruns.extend(play_through(character, rng))
+
+        tracemalloc.start()
+        try:
+            memory_reruns = play_through(character, random.Random(seed), trace_memory=True)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "scene_digest": load_scene_store().digest,
+        "playthroughs": playthroughs,
+        "character": character,
+        "seed": seed,
+        "screens": summarize(reruns, memory_reruns),
+        "reruns": [rerun._asdict() for rerun in reruns],
+    }
+
+
+def compare(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Return regression messages for screens slower or heavier than baseline"""
+    regressions = []
+    for screen, current in report["screens"].items():
+        previous = baseline["screens"].get(screen)
+        if previous is None:
+            continue
+        for metric in ("wall_ms_p50", "markdown_bytes_mean", "wire_bytes_mean", "peak_kib_max"):
+            old, new = previous.get(metric), current.get(metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append(f"{screen}.{metric}: {old:.1f} -> {new:.1f} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark rerun latency of the game screens")
+    parser.add_argument("--playthroughs", type=int, default=3)
+    parser.add_argument("--character", choices=sorted(CHARACTER_BUTTONS), default="Hürrem")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_REPORT)
+    parser.add_argument("--baseline", help="previous report to check for regressions")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.playthroughs, args.character, args.seed)
+    Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    print(f"{'screen':<20} {'reruns':>6} {'p50 ms':>8} {'p95 ms':>8} {'html B':>8} {'wire B':>10} {'peak KiB':>9}")
+    for screen, stats in report["screens"].items():
+        peak = stats["peak_kib_max"]
+        print(f"{screen:<20} {stats['reruns']:>6} {stats['wall_ms_p50']:>8.1f} {stats['wall_ms_p95']:>8.1f} "
+              f"{stats['markdown_bytes_mean']:>8.0f} {stats['wire_bytes_mean']:>10.0f} "
+              f"{peak if peak is None else round(peak):>9}")
+    print(f"Report written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import hashlib
+import io
+import json
+import math
+import sys
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+# --- PORTRAIT ATLAS BUILD ---
+# Packs every portrait in images/ into one sprite sheet of square cells so the
+# whole cast costs a single cached fetch. Cells are stored at 2x the display
+# size; portraits.py scales them down with background-size. Writes a WebP
+# sheet, a JPEG fallback and a coordinate manifest to static/atlas/.
+# Requires Pillow.
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_DIR = ROOT / "images"
+OUTPUT_DIR = ROOT / "static" / "atlas"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+CELL_SIZE = 200
+SOURCE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+# Backgrounds are not portraits
+EXCLUDE = {"ottoman_background"}
+
+
+def portrait_names(sources):
+    """Name each source by its stem; clashing stems keep the extension"""
+    stems = [source.stem for source in sources]
+    names = {}
+    for source in sources:
+        clash = stems.count(source.stem) > 1 and source.suffix.lower() != ".png"
+        names[source] = f"{source.stem}_{source.suffix.lower().lstrip('.')}" if clash else source.stem
+    return names
+
+
+def _save(sheet, path_stem, fmt, **options):
+    buffer = io.BytesIO()
+    sheet.save(buffer, fmt, **options)
+    data = buffer.getvalue()
+    path = OUTPUT_DIR / f"{path_stem}.{hashlib.sha1(data).hexdigest()[:10]}.{fmt.lower().replace('jpeg', 'jpg')}"
+    path.write_bytes(data)
+    return path.relative_to(ROOT).as_posix()
+
+
+def build(source_dir=SOURCE_DIR):
+    """Pack the portraits into a sheet and write the manifest"""
+    sources = sorted(
+        source for source in source_dir.iterdir()
+        if source.suffix.lower() in SOURCE_SUFFIXES and source.stem not in EXCLUDE
+    )
+    names = portrait_names(sources)
+    columns = math.ceil(math.sqrt(len(sources)))
+    rows = math.ceil(len(sources) / columns)
+    sheet = Image.new("RGB", (columns * CELL_SIZE, rows * CELL_SIZE), "#F5E6D3")
+
+    portraits = {}
+    paths = {}
+    for i, source in enumerate(sources):
+        x, y = (i % columns) * CELL_SIZE, (i // columns) * CELL_SIZE
+        with Image.open(source) as image:
+            cell = ImageOps.fit(image.convert("RGB"), (CELL_SIZE, CELL_SIZE), Image.LANCZOS)
+        sheet.paste(cell, (x, y))
+        portraits[names[source]] = {"x": x, "y": y, "w": CELL_SIZE, "h": CELL_SIZE}
+        paths[source.relative_to(ROOT).as_posix()] = names[source]
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in OUTPUT_DIR.iterdir():
+        stale.unlink()
+    manifest = {
+        "sheet": _save(sheet, "portraits", "WEBP", quality=80, method=6),
+        "fallback": _save(sheet, "portraits", "JPEG", quality=82, optimize=True, progressive=True),
+        "width": sheet.width,
+        "height": sheet.height,
+        "portraits": portraits,
+        "paths": paths,
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    manifest = build(Path(argv[0]) if argv else SOURCE_DIR)
+    sheet_bytes = (ROOT / manifest["sheet"]).stat().st_size
+    print(f"{len(manifest['portraits'])} portraits -> {manifest['sheet']} "
+          f"({manifest['width']}x{manifest['height']}, {sheet_bytes} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+# --- AUDIO BUILD ---
+# Transcodes everything in sounds/ to low-bitrate Opus (WebM) and AAC (M4A),
+# trimming leading/trailing silence and normalising loudness on the way, and
+# writes the content-hashed results plus a manifest to static/audio/ for
+# audio_assets.py. The short effects are also packed into one sprite with a
+# cue sheet, so a session fetches them all at once. Inline mode embeds the
+# music as base64 in the page, so it gets its own smaller mono AAC build
+# (INLINE_MUSIC) instead of the stereo variant. Requires ffmpeg and ffprobe
+# on PATH.
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_DIR = ROOT / "sounds"
+OUTPUT_DIR = ROOT / "static" / "audio"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+SPRITE_PATH = OUTPUT_DIR / "sprite.json"
+SOURCE_SUFFIXES = {".mp3", ".wav", ".ogg", ".m4a", ".flac"}
+
+# The looping background track; everything else is a short mono effect
+MUSIC = {"decision"}
+# Integrated loudness targets (LUFS): effects sit above the music bed
+LOUDNESS = {"music": -20, "effect": -16}
+SILENCE_THRESHOLD = "-50dB"
+SAMPLE_RATE = 48000
+# Silence between sprite cues, enough to absorb encoder priming and timer slop
+SPRITE_GAP = 0.5
+
+FORMATS = {
+    "opus": {"ext": "webm", "type": "audio/webm; codecs=opus",
+             "args": ["-c:a", "libopus", "-vbr", "on", "-application", "audio"],
+             "bitrate": {"music": "32k", "effect": "24k"}},
+    "aac": {"ext": "m4a", "type": "audio/mp4; codecs=mp4a.40.2",
+            "args": ["-c:a", "aac", "-movflags", "+faststart"],
+            "bitrate": {"music": "48k", "effect": "32k"}},
+}
+# 102 s of decision.mp3 at 24 kb/s is ~306 KB, ~408 KB once base64 encoded
+INLINE_MUSIC = {"format": "aac", "bitrate": "24k", "channels": 1}
+# Per-session audio budget the build reports against, as sent in inline mode
+SESSION_BUDGET = 500 * 1024
+
+
+def _filters(kind):
+    trim = f"silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD}"
+    # silenceremove only trims the start reliably, so run it on the reversed
+    # signal as well to trim the tail
+    return ",".join([trim, "areverse", trim, "areverse",
+                     f"loudnorm=I={LOUDNESS[kind]}:TP=-1.5:LRA=11"])
+
+
+def probe_duration(path):
+    """Return the duration of an audio file in seconds"""
+    out = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return round(float(out), 3)
+
+
+def transcode(source, fmt, kind, normalise=True, bitrate=None, channels=None):
+    """Encode one source in one format and return the encoded bytes"""
+    spec = FORMATS[fmt]
+    if channels is None:
+        channels = 2 if kind == "music" else 1
+    # Both muxers want a seekable output (faststart, WebM cues), so no pipe
+    tmp = OUTPUT_DIR / f".{source.stem}.tmp.{spec['ext']}"
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-y", "-i", str(source), "-vn", "-map_metadata", "-1",
+        "-af", _filters(kind) if normalise else "anull",
+        "-ac", str(channels), "-ar", str(SAMPLE_RATE),
+        *spec["args"], "-b:a", bitrate or spec["bitrate"][kind], str(tmp),
+    ], check=True)
+    try:
+        return tmp.read_bytes()
+    finally:
+        tmp.unlink()
+
+
+def _write_variant(source, fmt, data):
+    spec = FORMATS[fmt]
+    path = OUTPUT_DIR / f"{source.stem}.{hashlib.sha1(data).hexdigest()[:10]}.{spec['ext']}"
+    if not path.exists():
+        path.write_bytes(data)
+    return {"path": path.relative_to(ROOT).as_posix(), "type": spec["type"], "bytes": len(data)}
+
+
+def _write_variants(source, kind, normalise=True):
+    variants = [_write_variant(source, fmt, transcode(source, fmt, kind, normalise)) for fmt in FORMATS]
+    variants.sort(key=lambda variant: variant["bytes"])
+    return variants
+
+
+def build_sound(source):
+    """Write all variants of one sound and return its manifest entry"""
+    kind = "music" if source.stem in MUSIC else "effect"
+    variants = _write_variants(source, kind)
+    entry = {"kind": kind, "duration": probe_duration(ROOT / variants[0]["path"]), "variants": variants}
+    if kind == "music":
+        # Kept out of "variants" so url mode never prefers it over Opus
+        fmt = INLINE_MUSIC["format"]
+        data = transcode(source, fmt, kind, bitrate=INLINE_MUSIC["bitrate"], channels=INLINE_MUSIC["channels"])
+        entry["inline"] = _write_variant(source, fmt, data)
+    return entry
+
+
+def _decode_pcm(source):
+    """Return the trimmed, normalised effect as mono 16-bit PCM frames"""
+    return subprocess.run([
+        "ffmpeg", "-v", "error", "-i", str(source), "-vn", "-af", _filters("effect"),
+        "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "pipe:1",
+    ], check=True, capture_output=True).stdout
+
+
+def build_sprite(sources):
+    """Pack the effects into one sprite and return its cue sheet"""
+    # Concatenating decoded PCM keeps every cue offset sample-exact
+    gap = b"\0\0" * int(SPRITE_GAP * SAMPLE_RATE)
+    pcm = bytearray()
+    cues = {}
+    for source in sources:
+        frames = _decode_pcm(source)
+        cues[source.relative_to(ROOT).as_posix()] = [
+            round(len(pcm) / 2 / SAMPLE_RATE, 3), round(len(frames) / 2 / SAMPLE_RATE, 3),
+        ]
+        pcm += frames + gap
+
+    sprite = OUTPUT_DIR / "sfx.wav"
+    with wave.open(str(sprite), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        out.writeframes(bytes(pcm))
+    try:
+        variants = _write_variants(sprite, "effect", normalise=False)
+    finally:
+        sprite.unlink()
+    return {"cues": cues, "variants": variants}
+
+
+def build(source_dir=SOURCE_DIR):
+    """Build every sound in source_dir and write the manifest"""
+    for tool in ("ffmpeg", "ffprobe"):
+        if shutil.which(tool) is None:
+            raise SystemExit(f"{tool} not found on PATH")
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for source in sorted(source_dir.iterdir()):
+        if source.suffix.lower() in SOURCE_SUFFIXES:
+            manifest[source.relative_to(ROOT).as_posix()] = build_sound(source)
+    effects = [ROOT / path for path, entry in manifest.items() if entry["kind"] == "effect"]
+    sprite = build_sprite(effects)
+
+    # Drop variants from earlier builds that the manifests no longer reference
+    referenced = {variant["path"] for entry in [*manifest.values(), sprite] for variant in entry["variants"]}
+    referenced.update(entry["inline"]["path"] for entry in manifest.values() if "inline" in entry)
+    for stale in OUTPUT_DIR.iterdir():
+        if stale not in (MANIFEST_PATH, SPRITE_PATH) and stale.relative_to(ROOT).as_posix() not in referenced:
+            stale.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    SPRITE_PATH.write_text(json.dumps(sprite, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest, sprite
+
+
+def inline_session_bytes(manifest, sprite):
+    """Return the base64 bytes of audio an inline-mode session can be sent
+
+    That is the music, the effect sprite and one character sound, which
+    plays on its own; the largest effect stands in for the latter.
+    """
+    def inline(entry):
+        variant = entry.get("inline") or next(v for v in entry["variants"] if v["type"] == FORMATS["aac"]["type"])
+        return (variant["bytes"] + 2) // 3 * 4
+
+    music = sum(inline(entry) for entry in manifest.values() if entry["kind"] == "music")
+    character = max((inline(entry) for entry in manifest.values() if entry["kind"] != "music"), default=0)
+    return music + inline(sprite) + character
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    manifest, sprite = build(Path(argv[0]) if argv else SOURCE_DIR)
+    source_bytes = sum((ROOT / path).stat().st_size for path in manifest)
+    smallest = sum(entry["variants"][0]["bytes"] for entry in manifest.values())
+    print(f"{len(manifest)} sounds -> {MANIFEST_PATH.relative_to(ROOT)} "
+          f"(sources {source_bytes} bytes, smallest variants {smallest} bytes)")
+    print(f"{len(sprite['cues'])} effects -> {SPRITE_PATH.relative_to(ROOT)} "
+          f"(smallest sprite {sprite['variants'][0]['bytes']} bytes)")
+    session = inline_session_bytes(manifest, sprite)
+    print(f"Inline session audio: {session} bytes of base64 "
+          f"({'within' if session <= SESSION_BUDGET else 'OVER'} the {SESSION_BUDGET // 1024} KB budget)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import string
+import sys
+from pathlib import Path
+
+from fontTools import subset
+
+# --- WEBFONT BUILD ---
+# Subsets fonts/papyrus.ttf down to the glyphs the game can actually show
+# (ASCII, Turkish letters and every character in the story and UI text) and
+# writes it as WOFF2 next to the source. Requires fonttools and brotli.
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_FONT = ROOT / "fonts" / "papyrus.ttf"
+SUBSET_FONT = ROOT / "fonts" / "papyrus-subset.woff2"
+TEXT_SOURCES = (ROOT / "data" / "scenarios.json", ROOT / "muhtesem_oyun.py")
+EXTRA_TEXT = string.printable + "ÇçĞğİıÖöŞşÜüÂâÎîÛû’‘“”…–—«»"
+
+
+def used_text():
+    """Return every character the game can render with the webfont"""
+    chars = set(EXTRA_TEXT)
+    for path in TEXT_SOURCES:
+        chars.update(path.read_text(encoding="utf-8"))
+    return "".join(sorted(ch for ch in chars if ch.isprintable()))
+
+
+def build(source=SOURCE_FONT, output=SUBSET_FONT):
+    """Write a WOFF2 subset of the source font and return its size"""
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.desubroutinize = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=used_text())
+    subsetter.subset(font)
+    subset.save_font(font, str(output), options)
+    return output.stat().st_size
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    output = Path(argv[0]) if argv else SUBSET_FONT
+    size = build(output=output)
+    print(f"{SOURCE_FONT} -> {output} ({SOURCE_FONT.stat().st_size} -> {size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
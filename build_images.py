@@ -0,0 +1,96 @@
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image, features
+
+# --- IMAGE BUILD ---
+# Resizes everything in images/ to the size it is displayed at (1x and 2x)
+# and writes WebP, AVIF (when Pillow supports it) and a PNG/JPEG fallback
+# under static/img/ with content-hashed names, plus a manifest that
+# image_assets.py reads at runtime. Requires Pillow.
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_DIR = ROOT / "images"
+OUTPUT_DIR = ROOT / "static" / "img"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+DISPLAY_WIDTH = 100
+DENSITIES = (1, 2)
+SOURCE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+FORMATS = {
+    "avif": {"format": "AVIF", "quality": 55},
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "png": {"format": "PNG", "optimize": True},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+
+def _encode(image, fmt):
+    options = dict(FORMATS[fmt])
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+
+def _write_variant(stem, width, fmt, data):
+    digest = hashlib.sha1(data).hexdigest()[:10]
+    path = OUTPUT_DIR / f"{stem}-{width}w.{digest}.{'jpg' if fmt == 'jpeg' else fmt}"
+    if not path.exists():
+        path.write_bytes(data)
+    return path.relative_to(ROOT).as_posix()
+
+
+def build_image(source):
+    """Write all variants of one image and return its manifest entry"""
+    with Image.open(source) as original:
+        original.load()
+    has_alpha = original.mode in ("RGBA", "LA", "P")
+    image = original.convert("RGBA" if has_alpha else "RGB")
+    fallback = "png" if has_alpha or source.suffix.lower() == ".png" else "jpeg"
+    formats = [fmt for fmt in ("avif", "webp") if features.check(fmt)] + [fallback]
+
+    entry = {"fallback": fallback, "variants": {fmt: {} for fmt in formats}}
+    for density in DENSITIES:
+        width = min(DISPLAY_WIDTH * density, image.width)
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        if density == 1:
+            entry["width"], entry["height"] = width, height
+        for fmt in formats:
+            entry["variants"][fmt][f"{density}x"] = _write_variant(source.stem, width, fmt, _encode(resized, fmt))
+    return entry
+
+
+def build(source_dir=SOURCE_DIR):
+    """Build every image in source_dir and write the manifest"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for source in sorted(source_dir.iterdir()):
+        if source.suffix.lower() in SOURCE_SUFFIXES:
+            manifest[source.relative_to(ROOT).as_posix()] = build_image(source)
+
+    # Drop variants from earlier builds that the manifest no longer references
+    referenced = {name for entry in manifest.values() for sizes in entry["variants"].values() for name in sizes.values()}
+    for stale in OUTPUT_DIR.iterdir():
+        if stale != MANIFEST_PATH and stale.relative_to(ROOT).as_posix() not in referenced:
+            stale.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    manifest = build(Path(argv[0]) if argv else SOURCE_DIR)
+    source_bytes = sum((ROOT / path).stat().st_size for path in manifest)
+    one_x = sum((ROOT / entry["variants"]["webp"]["1x"]).stat().st_size for entry in manifest.values()
+                if "webp" in entry["variants"])
+    print(f"{len(manifest)} images -> {MANIFEST_PATH.relative_to(ROOT)} "
+          f"(sources {source_bytes} bytes, 1x WebP {one_x} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import sys
+from array import array
+
+# --- SESSION DIAGNOSTICS ---
+# Rough per-session memory accounting: the deep size of everything a session
+# keeps in st.session_state. Objects shared by every session (scene store,
+# interned strings) are not reachable from session state and are not counted.
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+def deep_sizeof(obj, seen=None):
+    """Return the size in bytes of an object and everything it references"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, _CONTAINERS):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, (str, bytes, int, float, bool, array)) or obj is None:
+        pass
+    else:
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += deep_sizeof(getattr(obj, slot), seen)
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def session_footprint(session_state):
+    """Return {key: bytes} for a session plus a "total" entry"""
+    seen = set()
+    footprint = {str(key): deep_sizeof(session_state[key], seen) for key in list(session_state.keys())}
+    footprint["total"] = sum(footprint.values())
+    return footprint
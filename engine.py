@@ -0,0 +1,147 @@
+import threading
+from array import array
+from collections import Counter, namedtuple
+
+from scenes import SCORE_KEYS, load_scene_store
+
+# --- GAME ENGINE ---
+# Pure game rules with no Streamlit dependency. The UI in muhtesem_oyun.py,
+# simulations and tools all drive the game through these functions.
+
+GOOD_CHOICE_THRESHOLD = 2
+
+
+class InvalidChoice(ValueError):
+    """Raised when a choice does not apply to the current game state"""
+
+
+class StaleChoice(InvalidChoice):
+    """Raised for a choice token that is a duplicate or out of date"""
+
+
+# A choice is only valid for the (session, scene, move) it was rendered for,
+# so a double tap or a replayed request can never apply a second time
+ChoiceToken = namedtuple("ChoiceToken", "session scene move")
+
+# Process-wide count of rejected tokens by reason
+rejected_choices = Counter()
+_rejected_lock = threading.Lock()
+
+
+class GameState:
+    """Mutable state of one playthrough
+
+    history is a flat array('H') of (scene index, choice index) pairs; the
+    text of each move lives in the shared scene store and is looked up with
+    iter_history() when needed.
+    """
+
+    __slots__ = ("current_scene", "scores", "history", "selected_character")
+
+    def __init__(self, current_scene=None, scores=None, history=None, selected_character=None):
+        self.current_scene = current_scene or load_scene_store().start
+        self.scores = dict(scores) if scores else {score: 0 for score in SCORE_KEYS}
+        self.history = array("H", history or ())
+        self.selected_character = selected_character
+
+    def __repr__(self):
+        return f"GameState(current_scene={self.current_scene!r}, scores={self.scores!r}, moves={self.moves})"
+
+    @property
+    def moves(self):
+        """Number of choices made so far"""
+        return len(self.history) // 2
+
+    def to_dict(self):
+        """Return a plain-dict snapshot of the state"""
+        return {
+            "current_scene": self.current_scene,
+            "scores": dict(self.scores),
+            "history": self.history.tolist(),
+            "selected_character": self.selected_character,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a state from a to_dict() snapshot"""
+        return cls(data["current_scene"], data["scores"], data["history"], data.get("selected_character"))
+
+
+def choice_token(state, session=None):
+    """Return the token that choices rendered for this state carry"""
+    return ChoiceToken(session, state.current_scene, state.moves)
+
+
+def check_token(state, token, session=None):
+    """Raise StaleChoice, and count it, unless the token matches the state"""
+    if token.session != session:
+        reason = "session"
+    elif token.move < state.moves:
+        # Rendered before a move that has since been applied: a double tap
+        reason = "duplicate"
+    elif token.scene != state.current_scene or token.move != state.moves:
+        reason = "stale"
+    else:
+        return
+    with _rejected_lock:
+        rejected_choices[reason] += 1
+    raise StaleChoice(f"Choice token {tuple(token)} rejected ({reason}) at move {state.moves} in {state.current_scene!r}")
+
+
+def apply_choice(state, scene_key, choice_key, store=None, token=None, session=None):
+    """Apply a choice to the state and return the chosen Option
+
+    With a token the choice is checked first and dropped (StaleChoice) if it
+    was not rendered for this exact state.
+    """
+    if token is not None:
+        check_token(state, token, session)
+    store = store or load_scene_store()
+    if scene_key != state.current_scene:
+        raise InvalidChoice(f"Scene {scene_key!r} is not the current scene {state.current_scene!r}")
+    scene = store.get(scene_key)
+    if scene is None:
+        raise InvalidChoice(f"Scene {scene_key!r} does not exist")
+    for choice_index, option in enumerate(scene.options):
+        if option.key == choice_key:
+            break
+    else:
+        raise InvalidChoice(f"Scene {scene_key!r} has no option {choice_key!r}")
+
+    state.history.extend((scene.index, choice_index))
+    scores = state.scores
+    for score_type, change in zip(SCORE_KEYS, option.score_changes):
+        scores[score_type] += change
+    state.current_scene = option.next_scene
+    return option
+
+
+def iter_history(state, store=None):
+    """Yield (scene, option) records for every move of a playthrough"""
+    store = store or load_scene_store()
+    history = state.history
+    for i in range(0, len(history), 2):
+        scene = store.by_index[history[i]]
+        yield scene, scene.options[history[i + 1]]
+
+
+def is_finished(state, store=None):
+    """Return True once the current scene has no choices left"""
+    scene = (store or load_scene_store()).get(state.current_scene)
+    return scene is None or not scene.options
+
+
+def is_good_choice(option):
+    """Return True if a choice earns the positive sound effect"""
+    return sum(option.score_changes) > GOOD_CHOICE_THRESHOLD
+
+
+def winner(scores):
+    """Return the winning score category; ties go to the earlier category"""
+    highest_score = max(scores[score] for score in SCORE_KEYS)
+    return next(score for score in SCORE_KEYS if scores[score] == highest_score)
+
+
+def total_score(scores):
+    """Return the sum of all score categories"""
+    return sum(scores[score] for score in SCORE_KEYS)
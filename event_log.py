@@ -0,0 +1,224 @@
+import atexit
+import hashlib
+import os
+import struct
+import sys
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from scene_format import DATA_DIR
+
+# --- PLAYTHROUGH EVENT LOG ---
+# Every applied choice becomes one fixed-width record in append-only segment
+# files under data/events/, so playthroughs outlive their sessions:
+#
+#   header   magic, version, record size, scenario digest     (40 bytes)
+#   records  ts_us u64, session u64, scene u16, move u16,
+#            choice u8, harem/suleyman/divan deltas i8        (24 bytes each)
+#
+# session is a 64-bit hash of the session id and scene/choice are the same
+# indexes GameState.history stores. Those indexes only mean something
+# against the scenario they were logged under, so each segment records
+# SceneStore.digest and a content edit starts a new segment.
+# record() packs the event and appends it to a deque (atomic under the GIL,
+# so no lock on the hot path); a daemon thread drains the deque every
+# OYUN_EVENT_INTERVAL seconds and rotates to a new segment past
+# OYUN_EVENT_SEGMENT_BYTES or on a digest change. read_events() streams
+# segments back as NumPy structured arrays.
+
+EVENT_LOG = os.environ.get("OYUN_EVENT_LOG", "1") == "1"
+EVENT_DIR = Path(os.environ.get("OYUN_EVENT_DIR", str(DATA_DIR / "events")))
+SEGMENT_BYTES = int(os.environ.get("OYUN_EVENT_SEGMENT_BYTES", str(8 * 1024 * 1024)))
+FLUSH_INTERVAL = float(os.environ.get("OYUN_EVENT_INTERVAL", "1.0"))
+
+MAGIC = b"OYEV"
+VERSION = 2
+PREFIX = struct.Struct("<4sHH")
+# Version 1 segments end the header after the record size and carry no digest
+HEADER = struct.Struct("<4sHH32s")
+EVENT = struct.Struct("<QQHHBbbb")
+EVENT_DTYPE = np.dtype([
+    ("ts_us", "<u8"),
+    ("session", "<u8"),
+    ("scene", "<u2"),
+    ("move", "<u2"),
+    ("choice", "u1"),
+    ("harem", "i1"),
+    ("suleyman", "i1"),
+    ("divan", "i1"),
+])
+assert EVENT_DTYPE.itemsize == EVENT.size
+DEFAULT_CHUNK_RECORDS = 1 << 20
+
+
+@lru_cache(maxsize=4096)
+def session_hash(session_id):
+    """Return the 64-bit hash a session id is logged under"""
+    return int.from_bytes(hashlib.blake2b(str(session_id).encode(), digest_size=8).digest(), "little")
+
+
+class EventLog:
+    """Buffered, append-only writer of fixed-width choice events"""
+
+    def __init__(self, directory=EVENT_DIR, segment_bytes=SEGMENT_BYTES, interval=FLUSH_INTERVAL):
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.interval = interval
+        self._buffer = deque()
+        self._file = None
+        self._segment_size = 0
+        self._digest = None
+        # Only the drain side locks: flush() may run from the thread and close()
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.written = 0
+        self.segments = 0
+        self._thread = threading.Thread(target=self._run, name="oyun-event-log", daemon=True)
+        self._thread.start()
+
+    def record(self, session_id, scene_index, move, choice_index, deltas, digest=None, ts_us=None):
+        """Queue one choice event; costs a pack and a deque append
+
+        digest is the SceneStore.digest the indexes refer to.
+        """
+        self._buffer.append((digest, EVENT.pack(
+            ts_us if ts_us is not None else time.time_ns() // 1000,
+            session_hash(session_id), scene_index, move, choice_index, *deltas,
+        )))
+
+    def _open_segment(self, digest):
+        if self._file is not None:
+            self._file.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Time first so names sort chronologically; pid keeps replicas apart
+        path = self.directory / f"events-{time.time_ns()}-{os.getpid()}.bin"
+        self._file = open(path, "ab", buffering=0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, EVENT.size, bytes.fromhex(digest) if digest else b""))
+        self._segment_size = HEADER.size
+        self._digest = digest
+        self.segments += 1
+
+    def _write(self, digest, records):
+        if (self._file is None or digest != self._digest
+                or self._segment_size + len(records) * EVENT.size > self.segment_bytes):
+            self._open_segment(digest)
+        data = b"".join(records)
+        self._file.write(data)
+        self._segment_size += len(data)
+        self.written += len(records)
+
+    def flush(self):
+        """Write every queued event to the current segment"""
+        with self._drain_lock:
+            buffer = self._buffer
+            digest = None
+            records = []
+            while buffer:
+                event_digest, record = buffer.popleft()
+                # Write each run of events logged under one scenario together
+                if records and event_digest != digest:
+                    self._write(digest, records)
+                    records = []
+                digest = event_digest
+                records.append(record)
+            if records:
+                self._write(digest, records)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except OSError as exc:
+                print(f"event log: flush failed: {exc}", file=sys.stderr)
+
+    def stats(self):
+        return {"queued": len(self._buffer), "written": self.written, "segments": self.segments}
+
+
+def segment_paths(directory=EVENT_DIR):
+    """Return the segment files in chronological order"""
+    return sorted(Path(directory).glob("events-*.bin"))
+
+
+def read_header(path):
+    """Return (header size, scenario digest or None) of a segment"""
+    with open(path, "rb") as f:
+        data = f.read(HEADER.size)
+    magic, version, record_size = PREFIX.unpack_from(data)
+    if magic != MAGIC or version not in (1, VERSION) or record_size != EVENT.size:
+        raise ValueError(f"{path} is not a version {VERSION} event segment")
+    if version == 1:
+        return PREFIX.size, None
+    digest = HEADER.unpack_from(data)[3]
+    return HEADER.size, digest.hex() if digest.strip(b"\0") else None
+
+
+def segment_digest(path):
+    """Return the scenario digest a segment was logged under, or None"""
+    return read_header(path)[1]
+
+
+def read_segment(path):
+    """Return one segment's events as a structured array (memory-mapped)"""
+    header_size = read_header(path)[0]
+    # A crash can leave half a record at the end; ignore it
+    count = (os.path.getsize(path) - header_size) // EVENT.size
+    if count == 0:
+        return np.empty(0, dtype=EVENT_DTYPE)
+    return np.memmap(path, dtype=EVENT_DTYPE, mode="r", offset=header_size, shape=(count,))
+
+
+def read_events(directory=EVENT_DIR, chunk_records=DEFAULT_CHUNK_RECORDS, digest=None):
+    """Yield every logged event as structured arrays of at most chunk_records
+
+    With digest, only segments logged under that scenario are read.
+    """
+    for path in segment_paths(directory):
+        if digest is not None and segment_digest(path) != digest:
+            continue
+        events = read_segment(path)
+        for start in range(0, len(events), chunk_records):
+            yield events[start:start + chunk_records]
+
+
+# One writer per process, shared by every session like the session store
+event_log = EventLog() if EVENT_LOG else None
+if event_log is not None:
+    atexit.register(event_log.close)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    directory = Path(argv[0]) if argv else EVENT_DIR
+    paths = segment_paths(directory)
+    digests = Counter(segment_digest(path) for path in paths)
+    events = 0
+    sessions = set()
+    first = last = None
+    for chunk in read_events(directory):
+        events += len(chunk)
+        sessions.update(np.unique(chunk["session"]).tolist())
+        first = chunk["ts_us"].min() if first is None else min(first, chunk["ts_us"].min())
+        last = chunk["ts_us"].max() if last is None else max(last, chunk["ts_us"].max())
+    print(f"{events} events from {len(sessions)} sessions in {len(paths)} segments under {directory}")
+    if events:
+        print(f"From {time.ctime(first / 1e6)} to {time.ctime(last / 1e6)}")
+    for digest, count in digests.most_common():
+        print(f"  {count} segment(s) logged under scenario {digest[:12] if digest else 'unknown'}")
+
+
+if __name__ == "__main__":
+    main()
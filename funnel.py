@@ -0,0 +1,255 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from event_log import DEFAULT_CHUNK_RECORDS, EVENT_DIR, read_events, segment_digest, segment_paths
+from path_analyzer import topological_order
+from scenes import SCORE_KEYS, load_scene_store
+
+# --- CHOICE FUNNEL ANALYTICS ---
+# Offline job over the playthrough event log (event_log.py). Events are
+# streamed in chunks and every aggregate is a NumPy bincount/reduceat, so
+# memory grows with the number of sessions, never with the number of events.
+# Per-session state (last move, running scores) lives in sorted arrays that
+# each chunk is merged into.
+#
+#   scenes     per scene in story order: players who reached it, answered
+#              it, quit there, drop-off rate and mean seconds to answer
+#              (measured from the previous answer, so the first scene of a
+#              session has no timing)
+#   choices    per scene and option: count and share of answers
+#   outcomes   finished sessions by winning category, as render_game_end
+#              decides it, plus unfinished sessions
+#
+# Sessions that never answered the first scene leave no events and are not
+# counted. Only segments logged under the current scenario digest are read;
+# events from before a content edit point at other scenes and are skipped.
+# Output is CSV, or Parquet with --format parquet.
+
+DEFAULT_OUTPUT = Path("funnel_report")
+
+
+class SceneArrays:
+    """Store-indexed lookup arrays for the scenes events refer to"""
+
+    def __init__(self, store):
+        self.store = store
+        self.count = len(store)
+        self.max_options = max(len(scene.options) for scene in store.by_index) or 1
+        # next_index[scene, choice] is the store index the choice leads to
+        self.next_index = np.full((self.count, self.max_options), -1, dtype=np.int64)
+        for scene in store.by_index:
+            for j, option in enumerate(scene.options):
+                target = store.get(option.next_scene)
+                self.next_index[scene.index, j] = -1 if target is None else target.index
+        self.terminal = np.array([not scene.options for scene in store.by_index])
+
+
+class SessionTable:
+    """Per-session running aggregates, kept sorted by session hash"""
+
+    def __init__(self):
+        self.session = np.empty(0, dtype=np.uint64)
+        self.last_move = np.empty(0, dtype=np.int64)
+        self.last_ts = np.empty(0, dtype=np.int64)
+        self.last_scene = np.empty(0, dtype=np.int64)
+        self.last_choice = np.empty(0, dtype=np.int64)
+        self.totals = np.empty((0, len(SCORE_KEYS)), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.session)
+
+    def lookup(self, sessions):
+        """Return (row index, found mask) for sorted unique session hashes"""
+        idx = np.searchsorted(self.session, sessions)
+        found = idx < len(self.session)
+        found[found] = self.session[idx[found]] == sessions[found]
+        return idx, found
+
+    def merge(self, sessions, first_move, last_move, last_ts, last_scene, last_choice, totals):
+        """Fold one chunk's per-session summaries into the table"""
+        idx, found = self.lookup(sessions)
+        rows = idx[found]
+        self.totals[rows] += totals[found]
+        newer = last_move[found] > self.last_move[rows]
+        for name, values in (("last_move", last_move), ("last_ts", last_ts),
+                             ("last_scene", last_scene), ("last_choice", last_choice)):
+            getattr(self, name)[rows[newer]] = values[found][newer]
+
+        new = ~found
+        if new.any():
+            self.session = np.concatenate([self.session, sessions[new]])
+            self.last_move = np.concatenate([self.last_move, last_move[new]])
+            self.last_ts = np.concatenate([self.last_ts, last_ts[new]])
+            self.last_scene = np.concatenate([self.last_scene, last_scene[new]])
+            self.last_choice = np.concatenate([self.last_choice, last_choice[new]])
+            self.totals = np.concatenate([self.totals, totals[new]])
+            order = np.argsort(self.session, kind="stable")
+            for name in ("session", "last_move", "last_ts", "last_scene", "last_choice", "totals"):
+                setattr(self, name, getattr(self, name)[order])
+
+
+class Funnel:
+    """Streaming choice, timing and outcome aggregates over event chunks"""
+
+    def __init__(self, scenes):
+        self.scenes = scenes
+        self.choice_counts = np.zeros((scenes.count, scenes.max_options), dtype=np.int64)
+        self.seconds = np.zeros(scenes.count)
+        self.timed = np.zeros(scenes.count, dtype=np.int64)
+        self.sessions = SessionTable()
+        self.events = 0
+        self.skipped_segments = 0
+
+    def _add_times(self, scene, dt_us):
+        self.seconds += np.bincount(scene, weights=dt_us / 1e6, minlength=self.scenes.count)
+        self.timed += np.bincount(scene, minlength=self.scenes.count)
+
+    def add(self, chunk):
+        """Fold one structured array of events into the aggregates"""
+        if not len(chunk):
+            return
+        self.events += len(chunk)
+        ev = chunk[np.lexsort((chunk["move"], chunk["session"]))]
+        session = ev["session"]
+        move = ev["move"].astype(np.int64)
+        ts = ev["ts_us"].astype(np.int64)
+        scene = ev["scene"].astype(np.int64)
+        choice = ev["choice"].astype(np.int64)
+        deltas = np.stack([ev[score].astype(np.int64) for score in SCORE_KEYS], axis=1)
+
+        width = self.scenes.max_options
+        self.choice_counts += np.bincount(scene * width + choice, minlength=self.scenes.count * width).reshape(-1, width)
+
+        # Time to answer: gap to the same session's previous move in the chunk
+        same = session[1:] == session[:-1]
+        follows = same & (move[1:] == move[:-1] + 1)
+        self._add_times(scene[1:][follows], (ts[1:] - ts[:-1])[follows])
+
+        starts = np.flatnonzero(np.concatenate([[True], ~same]))
+        ends = np.concatenate([starts[1:], [len(ev)]]) - 1
+        sessions = session[starts]
+
+        # ...and to the previous move carried over from earlier chunks
+        idx, found = self.sessions.lookup(sessions)
+        rows = idx[found]
+        carried = self.sessions.last_move[rows] == move[starts][found] - 1
+        self._add_times(scene[starts][found][carried], (ts[starts][found] - self.sessions.last_ts[rows])[carried])
+
+        self.sessions.merge(
+            sessions, move[starts], move[ends], ts[ends], scene[ends], choice[ends],
+            np.add.reduceat(deltas, starts, axis=0),
+        )
+
+    def report(self):
+        """Return the scenes, choices and outcomes tables as DataFrames"""
+        scenes = self.scenes
+        store = scenes.store
+        table = self.sessions
+        next_index = scenes.next_index[table.last_scene, table.last_choice]
+        finished = (next_index < 0) | scenes.terminal[np.maximum(next_index, 0)]
+        stopped = np.bincount(next_index[~finished], minlength=scenes.count)
+
+        answered = self.choice_counts.sum(axis=1)
+        reached = answered + stopped
+        rows = []
+        for key in topological_order(store):
+            scene = store.get(key)
+            if scene is None or not scene.options:
+                continue
+            i = scene.index
+            rows.append({
+                "scene": key,
+                "reached": int(reached[i]),
+                "answered": int(answered[i]),
+                "quit_here": int(stopped[i]),
+                "drop_off_rate": stopped[i] / reached[i] if reached[i] else 0.0,
+                "mean_seconds": self.seconds[i] / self.timed[i] if self.timed[i] else float("nan"),
+                "timed_answers": int(self.timed[i]),
+            })
+
+        choices = []
+        for scene in store.by_index:
+            total = answered[scene.index]
+            for j, option in enumerate(scene.options):
+                count = self.choice_counts[scene.index, j]
+                choices.append({
+                    "scene": scene.key,
+                    "choice": option.key,
+                    "count": int(count),
+                    "share": count / total if total else 0.0,
+                })
+
+        # np.argmax keeps the first of equal scores, like engine.winner
+        winners = np.bincount(np.argmax(table.totals[finished], axis=1), minlength=len(SCORE_KEYS))
+        sessions = len(table)
+        outcomes = [{"outcome": score, "sessions": int(count)} for score, count in zip(SCORE_KEYS, winners)]
+        outcomes.append({"outcome": "unfinished", "sessions": int((~finished).sum())})
+        for row in outcomes:
+            row["share"] = row["sessions"] / sessions if sessions else 0.0
+
+        return {
+            "scenes": pd.DataFrame(rows),
+            "choices": pd.DataFrame(choices),
+            "outcomes": pd.DataFrame(outcomes),
+        }
+
+
+def analyze(directory=EVENT_DIR, store=None, chunk_records=DEFAULT_CHUNK_RECORDS):
+    """Stream the event log under directory and return the funnel tables"""
+    store = store or load_scene_store()
+    funnel = Funnel(SceneArrays(store))
+    if store.digest is not None:
+        funnel.skipped_segments = sum(segment_digest(path) != store.digest for path in segment_paths(directory))
+    for chunk in read_events(directory, chunk_records, digest=store.digest):
+        funnel.add(chunk)
+    return funnel, funnel.report()
+
+
+def write_report(tables, output=DEFAULT_OUTPUT, fmt="csv"):
+    """Write each table as output/<name>.csv or .parquet and return the paths"""
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, frame in tables.items():
+        path = output / f"{name}.{fmt}"
+        if fmt == "parquet":
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Choice funnel analytics over the playthrough event log")
+    parser.add_argument("events", nargs="?", type=Path, default=EVENT_DIR, help="event segment directory")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--chunk-records", type=int, default=DEFAULT_CHUNK_RECORDS)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    started = time.perf_counter()
+    funnel, tables = analyze(args.events, chunk_records=args.chunk_records)
+    paths = write_report(tables, args.output, args.format)
+    elapsed = time.perf_counter() - started
+
+    print(f"{funnel.events} events from {len(funnel.sessions)} sessions in {elapsed:.2f}s")
+    if funnel.skipped_segments:
+        print(f"Skipped {funnel.skipped_segments} segment(s) logged under another scenario version")
+    scenes = tables["scenes"]
+    if len(scenes) and scenes["quit_here"].sum():
+        worst = scenes.sort_values("drop_off_rate", ascending=False).head(5)
+        print("Highest drop-off:")
+        for row in worst.itertuples():
+            print(f"  {row.scene:<10} {row.drop_off_rate:6.1%} ({row.quit_here} of {row.reached})")
+    for path in paths:
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import json
+import mimetypes
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+import asset_server
+from asset_cache import asset_cache
+from asset_index import asset_index
+from tracing import traced
+
+# --- IMAGE MANIFEST ---
+# Runtime side of build_images.py: turns an images/... path into a
+# <picture> element with 1x/2x srcsets of the pre-sized variants. In asset
+# url mode the variants are linked; otherwise the 1x variant is inlined.
+# Without a manifest the original file is inlined as before.
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST_PATH = ROOT / "static" / "img" / "manifest.json"
+SOURCE_TYPES = (("avif", "image/avif"), ("webp", "image/webp"))
+
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    """Return the image manifest, or an empty dict if it was never built"""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _data_uri(path):
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return f"data:{mime};base64,{asset_cache.get_base64(path)}"
+
+
+def _variant_path(path):
+    """Return a manifest variant path that opens from any working directory"""
+    # Indexed paths stay relative so the cache can skip the filesystem
+    return path if asset_index.exists(path) else str(ROOT / path)
+
+
+def _inline_variant(entry):
+    variants = entry["variants"]
+    return variants.get("webp", variants[entry["fallback"]])["1x"]
+
+
+def inline_paths():
+    """Return the files inline mode embeds for the manifest's images"""
+    return [_variant_path(_inline_variant(entry)) for entry in load_manifest().values()]
+
+
+def _srcset(sizes):
+    return ", ".join(f"{asset_server.asset_url(path)} {density}" for density, path in sorted(sizes.items()))
+
+
+@traced(payload=len)
+def picture_html(img_path, alt, css_class=""):
+    """Return HTML that displays an image from the build manifest"""
+    alt = escape(alt)
+    entry = load_manifest().get(Path(img_path).as_posix())
+    if entry is None:
+        try:
+            src = _data_uri(img_path)
+        except FileNotFoundError:
+            src = img_path
+        return f'<img src="{src}" class="{css_class}" alt="{alt}"/>'
+
+    size = f'width="{entry["width"]}" height="{entry["height"]}"'
+    variants = entry["variants"]
+    if not asset_server.url_mode():
+        try:
+            src = _data_uri(_variant_path(_inline_variant(entry)))
+        except FileNotFoundError:
+            # Manifest without its build outputs: show the original instead
+            try:
+                src = _data_uri(img_path)
+            except FileNotFoundError:
+                src = img_path
+        return f'<img src="{src}" {size} class="{css_class}" alt="{alt}"/>'
+
+    fallback = variants[entry["fallback"]]
+    sources = "".join(
+        f'<source type="{mime}" srcset="{_srcset(variants[fmt])}">'
+        for fmt, mime in SOURCE_TYPES if fmt in variants
+    )
+    return (
+        f'<picture>{sources}<img src="{asset_server.asset_url(fallback["1x"])}" '
+        f'srcset="{_srcset(fallback)}" {size} class="{css_class}" alt="{alt}" loading="lazy"/></picture>'
+    )
+
+
+# Inline mode embeds these on every page; encode them once per process
+if asset_server.ASSET_MODE != "url":
+    asset_cache.warm(inline_paths())
@@ -0,0 +1,169 @@
+import json
+import sys
+import time
+
+from scenes import SCORE_KEYS, load_scene_store
+
+# --- PATH-SPACE ANALYZER ---
+# Every playthrough is a path through the scene graph, far too many to
+# enumerate (~3.4e30 for the current story). Instead the analyzer pushes a
+# {score key: number of paths} table along next_scene edges in topological
+# order, merging identical states as it goes.
+#
+# The full (harem, suleyman, divan) vector has ~500k distinct end states,
+# which is slow to merge in Python. Each question only needs a projection
+# of it, so each runs as its own small DP:
+#   totals / single categories  1D (sum or one score)
+#   winning category            2D (harem - suleyman, harem - divan)
+
+_STRIDE = 1 << 20
+_HALF = _STRIDE >> 1
+
+
+class SceneGraphCycle(ValueError):
+    """Raised when next_scene edges form a cycle"""
+
+
+def topological_order(store):
+    """Return the scenes reachable from the start in topological order"""
+    edges = {}
+    pending = [store.start]
+    while pending:
+        key = pending.pop()
+        if key in edges:
+            continue
+        scene = store.get(key)
+        targets = {option.next_scene for option in scene.options} if scene else set()
+        edges[key] = targets
+        pending.extend(targets)
+
+    in_degree = dict.fromkeys(edges, 0)
+    for targets in edges.values():
+        for target in targets:
+            in_degree[target] += 1
+
+    ready = [key for key, degree in in_degree.items() if degree == 0]
+    order = []
+    while ready:
+        key = ready.pop()
+        order.append(key)
+        for target in edges[key]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+
+    if len(order) != len(edges):
+        stuck = sorted(key for key, degree in in_degree.items() if degree)
+        raise SceneGraphCycle(f"Scene graph has a cycle through: {', '.join(stuck)}")
+    return order
+
+
+def propagate(store, delta_of, order=None):
+    """Count paths per projected end state
+
+    delta_of maps an option's score_changes tuple to an int offset; the
+    result maps each reachable end-state key to its number of paths.
+    """
+    order = order or topological_order(store)
+    states = {store.start: {0: 1}}
+    finals = {}
+    for key in order:
+        counts = states.pop(key, None)
+        if counts is None:
+            continue
+        scene = store.get(key)
+        if scene is None or not scene.options:
+            get = finals.get
+            for state, paths in counts.items():
+                finals[state] = get(state, 0) + paths
+            continue
+        for option in scene.options:
+            target = states.setdefault(option.next_scene, {})
+            delta = delta_of(option.score_changes)
+            get = target.get
+            for state, paths in counts.items():
+                state += delta
+                target[state] = get(state, 0) + paths
+    return finals
+
+
+def _pack_margins(changes):
+    harem, suleyman, divan = changes
+    return (harem - suleyman) * _STRIDE + (harem - divan)
+
+
+def _unpack_margins(state):
+    harem_over_suleyman, harem_over_divan = divmod(state + _HALF, _STRIDE)
+    return harem_over_suleyman, harem_over_divan - _HALF
+
+
+def margin_winner(harem_over_suleyman, harem_over_divan):
+    """Return the winning category from score margins, like engine.winner"""
+    if harem_over_suleyman >= 0 and harem_over_divan >= 0:
+        return "harem"
+    if harem_over_divan - harem_over_suleyman >= 0:
+        return "suleyman"
+    return "divan"
+
+
+def analyze(store=None):
+    """Return a report of the reachable end states of the scene graph"""
+    store = store or load_scene_store()
+    order = topological_order(store)
+
+    totals = propagate(store, sum, order)
+    categories = {
+        score: dict(sorted(propagate(store, lambda changes, i=i: changes[i], order).items()))
+        for i, score in enumerate(SCORE_KEYS)
+    }
+    outcome_paths = dict.fromkeys(SCORE_KEYS, 0)
+    margins = propagate(store, _pack_margins, order)
+    for state, paths in margins.items():
+        outcome_paths[margin_winner(*_unpack_margins(state))] += paths
+
+    return {
+        "scenes": len(order),
+        "paths": sum(totals.values()),
+        "outcome_paths": outcome_paths,
+        "best_total": max(totals),
+        "worst_total": min(totals),
+        "score_ranges": {score: [min(dist), max(dist)] for score, dist in categories.items()},
+        "total_distribution": dict(sorted(totals.items())),
+        "score_distributions": categories,
+        "margin_states": len(margins),
+    }
+
+
+def main(argv=None):
+    """Print the analysis as a summary, or as JSON with --json"""
+    argv = sys.argv[1:] if argv is None else argv
+    started = time.perf_counter()
+    report = analyze()
+    elapsed = time.perf_counter() - started
+
+    if "--json" in argv:
+        print(json.dumps(_stringify_counts(report), indent=2, ensure_ascii=False))
+        return
+
+    paths = report["paths"]
+    print(f"Scenes on reachable paths: {report['scenes']}")
+    print(f"Distinct playthroughs:     {paths} (~{float(paths):.3e})")
+    for score, count in report["outcome_paths"].items():
+        print(f"  {score:<9} wins on {count / paths:7.2%} of paths ({count})")
+    print(f"Total score range:         {report['worst_total']} .. {report['best_total']}")
+    for score, (low, high) in report["score_ranges"].items():
+        print(f"  {score:<9} {low} .. {high}")
+    print(f"Analyzed in {elapsed:.2f}s")
+
+
+def _stringify_counts(value):
+    # Path counts exceed JSON number precision, so emit them as strings
+    if isinstance(value, dict):
+        return {key: _stringify_counts(item) for key, item in value.items()}
+    if isinstance(value, int) and abs(value) >= 1 << 53:
+        return str(value)
+    return value
+
+
+if __name__ == "__main__":
+    main()
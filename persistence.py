@@ -0,0 +1,191 @@
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from scene_format import DATA_DIR
+
+# --- SESSION PERSISTENCE ---
+# Game progress is checkpointed outside st.session_state so a reconnect,
+# restart or redeploy can pick a run back up. Backends store one JSON
+# snapshot (GameState.to_dict()) per session id:
+#   SQLiteBackend   on disk, the default
+#   MemoryBackend   in-process stand-in for tests and throwaway runs
+# WriteBehind sits in front of either one: save() only records the latest
+# snapshot and a background thread writes pending ones in a single batch,
+# so a click never waits on the disk. Deletes go through the same thread,
+# after any write already in flight, so a reset cannot be undone by a late
+# write of the old run.
+
+PERSISTENCE = os.environ.get("OYUN_PERSISTENCE", "sqlite")
+SESSION_DB = os.environ.get("OYUN_SESSION_DB", str(DATA_DIR / "sessions.sqlite3"))
+FLUSH_INTERVAL = float(os.environ.get("OYUN_PERSIST_INTERVAL", "0.5"))
+
+
+class MemoryBackend:
+    """Snapshots in a dict; lost with the process"""
+
+    def __init__(self):
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def save_many(self, items):
+        with self._lock:
+            for session_id, snapshot in items:
+                self._snapshots[session_id] = json.dumps(snapshot)
+
+    def load(self, session_id):
+        with self._lock:
+            data = self._snapshots.get(session_id)
+        return None if data is None else json.loads(data)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._snapshots.pop(session_id, None)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """Snapshots in a SQLite table, one row per session"""
+
+    def __init__(self, path=SESSION_DB):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Used from the writer thread and the script threads, serialised by _lock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, snapshot TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def save_many(self, items):
+        now = time.time()
+        rows = [(session_id, json.dumps(snapshot), now) for session_id, snapshot in items]
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO sessions (id, snapshot, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET snapshot = excluded.snapshot, updated = excluded.updated",
+                rows,
+            )
+
+    def load(self, session_id):
+        with self._lock:
+            row = self._db.execute("SELECT snapshot FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def delete(self, session_id):
+        with self._lock:
+            self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class WriteBehind:
+    """Coalesce saves in memory and flush them to a backend in batches"""
+
+    def __init__(self, backend, interval=FLUSH_INTERVAL):
+        self.backend = backend
+        self.interval = interval
+        self._pending = {}
+        # Deleted session ids, until the backend delete has run
+        self._deleted = set()
+        self._lock = threading.Lock()
+        # Serialises flushes so deletes land after writes already started
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self.flushes = 0
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name="oyun-write-behind", daemon=True)
+        self._thread.start()
+
+    def save(self, session_id, snapshot):
+        """Queue a snapshot; a later save of the same session replaces it"""
+        with self._lock:
+            self._pending[session_id] = snapshot
+            self._deleted.discard(session_id)
+        self._wake.set()
+
+    def load(self, session_id):
+        """Return the newest snapshot, pending or stored, or None"""
+        with self._lock:
+            if session_id in self._deleted:
+                return None
+            snapshot = self._pending.get(session_id)
+        return snapshot if snapshot is not None else self.backend.load(session_id)
+
+    def delete(self, session_id):
+        """Forget a session now and remove it from the backend on the next flush"""
+        with self._lock:
+            self._pending.pop(session_id, None)
+            self._deleted.add(session_id)
+        self._wake.set()
+
+    def flush(self):
+        """Write every pending snapshot and apply every pending delete now"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                deleted = set(self._deleted)
+            if batch:
+                try:
+                    self.backend.save_many(batch.items())
+                except Exception:
+                    # Put the batch back unless a newer snapshot arrived meanwhile
+                    with self._lock:
+                        for session_id, snapshot in batch.items():
+                            self._pending.setdefault(session_id, snapshot)
+                    raise
+                self.flushes += 1
+                self.written += len(batch)
+            for session_id in deleted:
+                self.backend.delete(session_id)
+            with self._lock:
+                self._deleted -= deleted
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        self.backend.close()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            # Let a burst of clicks pile up into one transaction
+            time.sleep(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as exc:
+                print(f"session persistence: flush failed: {exc}", file=sys.stderr)
+
+    def stats(self):
+        with self._lock:
+            pending = len(self._pending)
+        return {"pending": pending, "flushes": self.flushes, "written": self.written}
+
+
+def make_backend(kind=PERSISTENCE):
+    """Return the backend named by OYUN_PERSISTENCE"""
+    if kind == "sqlite":
+        return SQLiteBackend()
+    if kind == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown OYUN_PERSISTENCE {kind!r}, expected 'sqlite' or 'memory'")
+
+
+# One writer per process, shared by every session like the asset cache
+session_store = WriteBehind(make_backend())
+atexit.register(session_store.close)
@@ -0,0 +1,245 @@
+import json
+import os
+import sys
+import time
+from bisect import bisect_left
+
+from path_analyzer import topological_order
+from scene_format import DATA_DIR
+from scenes import SCORE_KEYS, load_scene_store
+
+# --- OPTIMAL POLICY SOLVER ---
+# Which choices maximize a score? The scene graph is a DAG, so:
+#   harem / suleyman / divan / total   additive, so plain backward induction
+#                                      gives the best choice in every scene
+#   margin_<category>                  lead of that category over the best
+#                                      other one at the end (what decides
+#                                      engine.winner); not additive, so a
+#                                      forward DP over (scene, margins)
+#                                      finds the best playthrough
+#   pareto                             every end score vector no other
+#                                      playthrough beats in all three scores
+# Results are cached under data/policies/, keyed by the scenario digest.
+
+CACHE_DIR = DATA_DIR / "policies"
+LINEAR_OBJECTIVES = {
+    "harem": (1, 0, 0),
+    "suleyman": (0, 1, 0),
+    "divan": (0, 0, 1),
+    "total": (1, 1, 1),
+}
+MARGIN_OBJECTIVES = tuple(f"margin_{score}" for score in SCORE_KEYS)
+OBJECTIVES = tuple(LINEAR_OBJECTIVES) + MARGIN_OBJECTIVES
+
+
+def _path_scores(store, path):
+    totals = [0] * len(SCORE_KEYS)
+    for scene_key, choice_key in path:
+        for i, change in enumerate(store.option(scene_key, choice_key).score_changes):
+            totals[i] += change
+    return dict(zip(SCORE_KEYS, totals))
+
+
+def _backtrack(layers, key, state):
+    path = []
+    link = layers[key][state]
+    while link is not None:
+        key, state, choice = link
+        path.append([key, choice])
+        link = layers[key][state]
+    path.reverse()
+    return path
+
+
+def solve_linear(store, weights, order=None):
+    """Backward induction: return (best value, {scene: best choice})"""
+    order = order or topological_order(store)
+    value = {}
+    policy = {}
+    for key in reversed(order):
+        scene = store.get(key)
+        if scene is None or not scene.options:
+            value[key] = 0
+            continue
+        # Ties go to the first option, like the order they are shown in
+        best = None
+        for option in scene.options:
+            gain = sum(w * change for w, change in zip(weights, option.score_changes))
+            candidate = gain + value[option.next_scene]
+            if best is None or candidate > best:
+                best, policy[key] = candidate, option.key
+        value[key] = best
+    return value[store.start], policy
+
+
+def solve_margin(store, score, order=None):
+    """Forward DP over margins: return (best final lead of score, path)"""
+    order = order or topological_order(store)
+    i = SCORE_KEYS.index(score)
+    others = [j for j in range(len(SCORE_KEYS)) if j != i]
+
+    # layers[scene][(lead over each other score)] = (prev scene, prev state, choice)
+    layers = {store.start: {(0,) * len(others): None}}
+    best = None
+    for key in order:
+        states = layers.get(key)
+        if states is None:
+            continue
+        # Leads are added to from here on and the objective is their minimum,
+        # so a state behind another on both leads can never end up ahead
+        states = layers[key] = {state: states[state] for state in _non_dominated_pairs(states)}
+        scene = store.get(key)
+        if scene is None or not scene.options:
+            for state in states:
+                if best is None or min(state) > best[0]:
+                    best = (min(state), key, state)
+            continue
+        for option in scene.options:
+            changes = option.score_changes
+            delta = tuple(changes[i] - changes[j] for j in others)
+            target = layers.setdefault(option.next_scene, {})
+            for state in states:
+                target.setdefault(tuple(a + b for a, b in zip(state, delta)), (key, state, option.key))
+    return best[0], _backtrack(layers, best[1], best[2])
+
+
+def _non_dominated_pairs(points):
+    """Return the pairs no other pair beats or equals on both values"""
+    keep = []
+    for point in sorted(points, reverse=True):
+        if not keep or point[1] > keep[-1][1]:
+            keep.append(point)
+    return keep
+
+
+def _non_dominated(points):
+    """Return the points no other point beats or equals in every score"""
+    # In descending order only earlier points can dominate a later one, and
+    # all of them have at least its first score, so a 2D staircase over the
+    # other two scores (b ascending, c descending) answers each check
+    keep = []
+    stair_b = []
+    stair_c = []
+    for point in sorted(points, reverse=True):
+        _, b, c = point
+        idx = bisect_left(stair_b, b)
+        if idx < len(stair_b) and stair_c[idx] >= c:
+            continue
+        keep.append(point)
+        start = idx
+        while start > 0 and stair_c[start - 1] <= c:
+            start -= 1
+        stair_b[start:idx] = [b]
+        stair_c[start:idx] = [c]
+    return keep
+
+
+def pareto_front(store, order=None):
+    """Return [{scores, path}] for every Pareto-optimal end score vector"""
+    order = order or topological_order(store)
+    layers = {store.start: {(0,) * len(SCORE_KEYS): None}}
+    finals = []
+    for key in order:
+        states = layers.get(key)
+        if states is None:
+            continue
+        # Every predecessor has contributed by now, so prune before expanding
+        states = layers[key] = {point: states[point] for point in _non_dominated(states)}
+        scene = store.get(key)
+        if scene is None or not scene.options:
+            finals.extend((point, key) for point in states)
+            continue
+        for option in scene.options:
+            changes = option.score_changes
+            target = layers.setdefault(option.next_scene, {})
+            for point in states:
+                target.setdefault(tuple(a + b for a, b in zip(point, changes)), (key, point, option.key))
+
+    front = _non_dominated({point for point, _ in finals})
+    ends = dict(finals)
+    return [
+        {"scores": dict(zip(SCORE_KEYS, point)), "path": _backtrack(layers, ends[point], point)}
+        for point in front
+    ]
+
+
+def solve(store, objective, order=None):
+    """Return {value, scores, policy, path} for one objective"""
+    order = order or topological_order(store)
+    if objective in LINEAR_OBJECTIVES:
+        value, policy = solve_linear(store, LINEAR_OBJECTIVES[objective], order)
+        path = []
+        key = store.start
+        while key in policy:
+            path.append([key, policy[key]])
+            key = store.option(key, policy[key]).next_scene
+    elif objective in MARGIN_OBJECTIVES:
+        value, path = solve_margin(store, objective[len("margin_"):], order)
+        # The best choice depends on the scores so far, so the policy is
+        # the one along the optimal playthrough
+        policy = dict(path)
+    else:
+        raise ValueError(f"Unknown objective {objective!r}, expected one of {', '.join(OBJECTIVES)}")
+    return {"value": value, "scores": _path_scores(store, path), "policy": policy, "path": path}
+
+
+def solve_all(store=None, cache_dir=CACHE_DIR, refresh=False):
+    """Return every objective and the Pareto front, cached by scenario digest"""
+    store = store or load_scene_store()
+    cache_path = cache_dir / f"{store.digest}.json" if store.digest else None
+    if cache_path is not None and not refresh:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+
+    order = topological_order(store)
+    result = {
+        "digest": store.digest,
+        "objectives": {objective: solve(store, objective, order) for objective in OBJECTIVES},
+        "pareto": pareto_front(store, order),
+    }
+    if cache_path is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(result, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, cache_path)
+    return result
+
+
+def main(argv=None):
+    """Print the best playthrough per objective, the front with --pareto"""
+    argv = sys.argv[1:] if argv is None else argv
+    flags = {arg for arg in argv if arg.startswith("--")}
+    objectives = [arg for arg in argv if not arg.startswith("--")] or list(OBJECTIVES)
+    unknown = [objective for objective in objectives if objective not in OBJECTIVES]
+    if unknown:
+        raise SystemExit(f"Unknown objective(s) {', '.join(unknown)}; expected {', '.join(OBJECTIVES)}")
+
+    started = time.perf_counter()
+    result = solve_all(refresh="--refresh" in flags)
+    elapsed = time.perf_counter() - started
+
+    if "--json" in flags:
+        selected = {"digest": result["digest"], "objectives": {o: result["objectives"][o] for o in objectives}}
+        if "--pareto" in flags:
+            selected["pareto"] = result["pareto"]
+        print(json.dumps(selected, indent=2, ensure_ascii=False))
+        return
+
+    for objective in objectives:
+        solution = result["objectives"][objective]
+        scores = ", ".join(f"{score} {value}" for score, value in solution["scores"].items())
+        choices = "".join(choice for _, choice in solution["path"])
+        print(f"{objective:<16} {solution['value']:>5}  ({scores})")
+        print(f"{'':<16} {choices}")
+    if "--pareto" in flags:
+        print(f"Pareto front: {len(result['pareto'])} end score vectors")
+        for entry in sorted(result["pareto"], key=lambda e: tuple(e["scores"].values()), reverse=True):
+            print("  " + ", ".join(f"{score} {value}" for score, value in entry["scores"].items()))
+    print(f"Solved in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import json
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+import asset_server
+from asset_index import IMAGE_DIR, asset_index
+from image_assets import picture_html
+from tracing import traced
+
+# --- PORTRAITS ---
+# Runtime side of build_atlas.py. portrait_html("bali_bey") shows one cell of
+# the shared sprite sheet, so every portrait in the game comes from a single
+# cached fetch. The sheet is only linked in asset url mode; inline mode (or a
+# missing atlas) falls back to the per-image variants from image_assets.
+# Portraits are named by file stem, so scene data may refer to
+# images/gulfem.png while the file on disk is images/gulfem.jpg.
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST_PATH = ROOT / "static" / "atlas" / "manifest.json"
+DEFAULT_SIZE = 60
+
+
+@lru_cache(maxsize=None)
+def load_atlas():
+    """Return the atlas manifest, or None if it was never built"""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def portrait_source(name):
+    """Return the images/... file a portrait name stands for, or None"""
+    atlas = load_atlas()
+    if atlas:
+        source = next((path for path, portrait in atlas["paths"].items() if portrait == name), None)
+        if source:
+            return source
+    return asset_index.resolve_stem(f"{IMAGE_DIR}/{name}")
+
+
+@lru_cache(maxsize=None)
+def portrait_name(img_path):
+    """Return the portrait name of an images/... path, or None"""
+    path = Path(img_path)
+    atlas = load_atlas()
+    if atlas:
+        name = atlas["paths"].get(path.as_posix())
+        if name:
+            return name
+        if path.stem in atlas["portraits"]:
+            return path.stem
+    return path.stem if portrait_source(path.stem) else None
+
+
+@traced(payload=len)
+def portrait_html(name, alt=None, size=DEFAULT_SIZE, css_class="portrait"):
+    """Return HTML showing the named portrait at size x size pixels"""
+    if name is None:
+        return ""
+    alt = escape(alt or name)
+    atlas = load_atlas()
+    if atlas is None or name not in atlas["portraits"] or not asset_server.url_mode():
+        source = portrait_source(name)
+        return picture_html(source, alt, css_class) if source else ""
+
+    cell = atlas["portraits"][name]
+    scale = size / cell["w"]
+    sheet = asset_server.asset_url(atlas["sheet"])
+    fallback = asset_server.asset_url(atlas["fallback"])
+    style = (
+        f"width:{size}px;height:{size}px;"
+        f"background-image:url('{fallback}');"
+        f"background-image:image-set(url('{sheet}') type('image/webp'), url('{fallback}') type('image/jpeg'));"
+        f"background-size:{atlas['width'] * scale:g}px {atlas['height'] * scale:g}px;"
+        f"background-position:-{cell['x'] * scale:g}px -{cell['y'] * scale:g}px"
+    )
+    return f'<span class="{css_class}" role="img" aria-label="{alt}" style="{style}"></span>'
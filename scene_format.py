@@ -0,0 +1,156 @@
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+# --- SCENE FILE FORMAT ---
+# Story content lives in data/scenarios.json (same shape as the old Python
+# literal). "python scene_format.py" compiles it into data/scenarios.bin:
+#
+#   header   magic, version, string/scene/option counts, sha256 of the source
+#   offsets  (strings + 1) uint32 offsets into the string blob
+#   scenes   key, description, first option, option count, character fields
+#   options  key, text, outcome, harem/suleyman/divan deltas, next_scene
+#   blob     every distinct string once, UTF-8 encoded
+#
+# Every string is stored once in the string table and referenced by index.
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+SOURCE_PATH = DATA_DIR / "scenarios.json"
+COMPILED_PATH = DATA_DIR / "scenarios.bin"
+
+MAGIC = b"OYSC"
+VERSION = 1
+NO_STRING = 0xFFFFFFFF
+SCORE_KEYS = ("harem", "suleyman", "divan")
+CHARACTER_FIELDS = ("name", "image", "quote")
+
+HEADER = struct.Struct("<4sHHIII32s")
+OFFSET = struct.Struct("<I")
+SCENE = struct.Struct("<IIIHxxIII")
+OPTION = struct.Struct("<IIIbbbxI")
+
+
+def source_digest(source_bytes):
+    """Return the sha256 digest embedded in compiled files"""
+    return hashlib.sha256(source_bytes).digest()
+
+
+class StringTable:
+    """Deduplicating string table used while compiling"""
+
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def add(self, value):
+        if value is None:
+            return NO_STRING
+        sid = self.index.get(value)
+        if sid is None:
+            sid = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+
+def compile_scenarios(raw_scenarios, digest):
+    """Pack a scenarios dict into the binary scene format"""
+    strings = StringTable()
+    scene_rows = []
+    option_rows = []
+
+    for scene_key, scene in raw_scenarios.items():
+        options = scene.get("options", {})
+        character = scene.get("character") or {}
+        scene_rows.append(SCENE.pack(
+            strings.add(scene_key),
+            strings.add(scene["description"]),
+            len(option_rows),
+            len(options),
+            *(strings.add(character.get(field)) if character else NO_STRING for field in CHARACTER_FIELDS),
+        ))
+        for option_key, option in options.items():
+            changes = option["score_changes"]
+            option_rows.append(OPTION.pack(
+                strings.add(option_key),
+                strings.add(option["text"]),
+                strings.add(option["outcome"]),
+                *(changes.get(score, 0) for score in SCORE_KEYS),
+                strings.add(option["next_scene"]),
+            ))
+
+    encoded = [value.encode("utf-8") for value in strings.strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, 0, len(encoded), len(scene_rows), len(option_rows), digest),
+        b"".join(OFFSET.pack(offset) for offset in offsets),
+        b"".join(scene_rows),
+        b"".join(option_rows),
+        b"".join(encoded),
+    ])
+
+
+def read_compiled(buffer):
+    """Unpack a compiled buffer into (digest, scenes) with plain tuples
+
+    Each scene is (key, description, character, options) where character is
+    a dict or None and each option is (key, text, outcome, changes, next_scene).
+    """
+    magic, version, _, n_strings, n_scenes, n_options, digest = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a compiled scenario file")
+
+    pos = HEADER.size
+    offsets = struct.unpack_from(f"<{n_strings + 1}I", buffer, pos)
+    pos += OFFSET.size * (n_strings + 1)
+    scenes_pos = pos
+    options_pos = scenes_pos + SCENE.size * n_scenes
+    blob_pos = options_pos + OPTION.size * n_options
+
+    blob = buffer[blob_pos:blob_pos + offsets[-1]]
+    strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+
+    def string(sid):
+        return None if sid == NO_STRING else strings[sid]
+
+    options = [
+        (string(key), string(text), string(outcome), (harem, suleyman, divan), string(next_scene))
+        for key, text, outcome, harem, suleyman, divan, next_scene
+        in OPTION.iter_unpack(buffer[options_pos:blob_pos])
+    ]
+    scenes = []
+    for key, description, first, count, *character in SCENE.iter_unpack(buffer[scenes_pos:options_pos]):
+        if character[0] == NO_STRING:
+            character = None
+        else:
+            character = dict(zip(CHARACTER_FIELDS, map(string, character)))
+        scenes.append((string(key), string(description), character, options[first:first + count]))
+    return digest, scenes
+
+
+def load_compiled(path=COMPILED_PATH):
+    """Memory-map a compiled scenario file and unpack it"""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return read_compiled(buffer)
+
+
+def main(argv=None):
+    """Compile the JSON scenario file into its binary form"""
+    argv = sys.argv[1:] if argv is None else argv
+    source = Path(argv[0]) if argv else SOURCE_PATH
+    output = Path(argv[1]) if len(argv) > 1 else source.with_suffix(".bin")
+
+    source_bytes = source.read_bytes()
+    compiled = compile_scenarios(json.loads(source_bytes), source_digest(source_bytes))
+    output.write_bytes(compiled)
+    print(f"{source} -> {output} ({len(source_bytes)} -> {len(compiled)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import json
+import sys
+import time
+from collections import Counter, deque
+
+from scene_format import SCORE_KEYS, SOURCE_PATH
+
+# --- SCENE GRAPH VALIDATOR ---
+# Checks the hand-written scenario data before it ships. It reads the JSON
+# directly, without Streamlit or the scene store, so it is quick enough for a
+# pre-commit hook. Errors break the game: duplicate keys, malformed options,
+# dangling next_scene targets, a missing start scene, cycles. Warnings point
+# at dead content: unreachable scenes and endings other than the final scene.
+#
+#   python scene_validator.py [scenarios.json] [--json] [--strict] [--verbose]
+#
+# Exits 1 on errors, or on warnings too with --strict.
+
+START_SCENE = "bolum_1"
+END_SCENES = ("final",)
+OPTION_FIELDS = ("text", "outcome", "score_changes", "next_scene")
+
+
+def load_checked(source=SOURCE_PATH):
+    """Parse the scenario JSON, returning (scenarios, duplicate key paths)
+
+    json.load keeps the last of two equal keys without a word, which is how
+    scenes used to vanish from the old Python literal; this keeps track.
+    """
+    duplicates = []
+
+    def pairs_hook(pairs):
+        counts = Counter(key for key, _ in pairs)
+        duplicates.extend(key for key, count in counts.items() if count > 1)
+        return dict(pairs)
+
+    with open(source, encoding="utf-8") as f:
+        return json.load(f, object_pairs_hook=pairs_hook), duplicates
+
+
+def adjacency(scenarios):
+    """Return {scene: [next_scene, ...]} in option order"""
+    return {
+        key: [option.get("next_scene") for option in (scene.get("options") or {}).values()]
+        for key, scene in scenarios.items()
+    }
+
+
+def check_structure(scenarios):
+    """Return error messages for scenes and options missing required fields"""
+    errors = []
+    for key, scene in scenarios.items():
+        if not isinstance(scene.get("description"), str):
+            errors.append(f"{key}: missing description")
+        for choice, option in (scene.get("options") or {}).items():
+            missing = [field for field in OPTION_FIELDS if field not in option]
+            if missing:
+                errors.append(f"{key}/{choice}: missing {', '.join(missing)}")
+            unknown = set(option.get("score_changes") or {}) - set(SCORE_KEYS)
+            if unknown:
+                errors.append(f"{key}/{choice}: unknown score keys {', '.join(sorted(unknown))}")
+    return errors
+
+
+def strongly_connected(edges):
+    """Return the strongly connected components of a graph (iterative Tarjan)"""
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    components = []
+    counter = 0
+    for root in edges:
+        if root in index:
+            continue
+        work = [(root, iter(edges[root]))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target not in edges:
+                    continue
+                if target not in index:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(edges[target])))
+                    break
+                if target in on_stack:
+                    low[node] = min(low[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def cycles(edges):
+    """Return the groups of scenes that can lead back to themselves"""
+    return [
+        sorted(component) for component in strongly_connected(edges)
+        if len(component) > 1 or component[0] in edges[component[0]]
+    ]
+
+
+def depths(edges, start):
+    """Return the fewest moves from the start to each reachable scene"""
+    depth = {start: 0}
+    queue = deque([start])
+    while queue:
+        key = queue.popleft()
+        for target in edges.get(key, ()):
+            if target in edges and target not in depth:
+                depth[target] = depth[key] + 1
+                queue.append(target)
+    return depth
+
+
+def longest_depth(edges, start, reachable):
+    """Return the most moves any playthrough can take (graph must be acyclic)"""
+    in_degree = dict.fromkeys(reachable, 0)
+    for key in reachable:
+        for target in set(edges[key]):
+            if target in in_degree:
+                in_degree[target] += 1
+    longest = dict.fromkeys(reachable, 0)
+    ready = [start]
+    while ready:
+        key = ready.pop()
+        for target in set(edges[key]):
+            if target not in in_degree:
+                continue
+            longest[target] = max(longest[target], longest[key] + 1)
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+    return max(longest.values(), default=0)
+
+
+def validate(scenarios, duplicates=(), start=START_SCENE, end_scenes=END_SCENES):
+    """Check a scenarios dict and return the report"""
+    edges = adjacency(scenarios)
+    errors = [f"duplicate key: {key}" for key in duplicates]
+    errors += check_structure(scenarios)
+    if start not in edges:
+        errors.append(f"start scene {start} does not exist")
+
+    for key, targets in edges.items():
+        for target in targets:
+            if target not in edges:
+                errors.append(f"{key}: next_scene {target} does not exist")
+
+    loops = cycles(edges)
+    errors += [f"cycle: {' -> '.join(loop)}" for loop in loops]
+
+    depth = depths(edges, start) if start in edges else {}
+    unreachable = [key for key in edges if key not in depth]
+    dead_ends = [key for key, targets in edges.items() if not targets and key not in end_scenes]
+    warnings = [f"unreachable: {key}" for key in unreachable]
+    warnings += [f"dead end: {key} has no options" for key in dead_ends]
+
+    in_degree = Counter(target for targets in edges.values() for target in set(targets) if target in edges)
+    return {
+        "scenes": len(edges),
+        # Every option, versus the distinct successor pairs degrees count
+        "options": sum(len(targets) for targets in edges.values()),
+        "edges": sum(len(set(targets)) for targets in edges.values()),
+        "reachable": len(depth),
+        "unreachable": unreachable,
+        "dead_ends": dead_ends,
+        "cycles": loops,
+        "errors": errors,
+        "warnings": warnings,
+        "shortest_depth": {key: depth[key] for key in end_scenes if key in depth},
+        "longest_depth": longest_depth(edges, start, depth) if depth and not loops else None,
+        "degrees": {
+            key: {"in": in_degree[key], "out": len(set(targets)), "options": len(targets)}
+            for key, targets in edges.items()
+        },
+        "depth": depth,
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    flags = {arg for arg in argv if arg.startswith("--")}
+    paths = [arg for arg in argv if not arg.startswith("--")]
+    started = time.perf_counter()
+    scenarios, duplicates = load_checked(paths[0] if paths else SOURCE_PATH)
+    report = validate(scenarios, duplicates)
+    elapsed = time.perf_counter() - started
+
+    failed = bool(report["errors"]) or ("--strict" in flags and bool(report["warnings"]))
+    if "--json" in flags:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 1 if failed else 0
+
+    for message in report["errors"]:
+        print(f"ERROR   {message}")
+    for message in report["warnings"]:
+        print(f"WARNING {message}")
+    if "--verbose" in flags:
+        print(f"{'scene':<12} {'in':>3} {'out':>3} {'opts':>4} {'depth':>5}")
+        for key, degree in report["degrees"].items():
+            print(f"{key:<12} {degree['in']:>3} {degree['out']:>3} {degree['options']:>4} "
+                  f"{report['depth'].get(key, '-'):>5}")
+
+    degrees = report["degrees"].values()
+    print(f"{report['scenes']} scenes, {report['options']} options, {report['edges']} distinct edges, "
+          f"{report['reachable']} reachable, "
+          f"{len(report['unreachable'])} unreachable, {len(report['dead_ends'])} dead ends, "
+          f"{len(report['cycles'])} cycles")
+    if degrees:
+        print(f"Distinct successors {min(d['out'] for d in degrees)}..{max(d['out'] for d in degrees)}, "
+          f"options {min(d['options'] for d in degrees)}..{max(d['options'] for d in degrees)}, "
+              f"in-degree {min(d['in'] for d in degrees)}..{max(d['in'] for d in degrees)}")
+    for key, moves in report["shortest_depth"].items():
+        print(f"Shortest path to {key}: {moves} moves")
+    if report["longest_depth"] is not None:
+        print(f"Longest playthrough: {report['longest_depth']} moves")
+    print(f"{len(report['errors'])} errors, {len(report['warnings'])} warnings in {elapsed * 1000:.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
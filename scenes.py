@@ -0,0 +1,118 @@
+import json
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from scene_format import COMPILED_PATH, SCORE_KEYS, SOURCE_PATH, load_compiled, source_digest
+
+# --- CHARACTER DATA ---
+characters = (
+    {
+        "name": "Süleyman",
+        "img": "images/sultan.png",
+        "sound": "sounds/diger.mp3"
+    },
+    {
+        "name": "Pargalı",
+        "img": "images/pargali.png", 
+        "sound": "sounds/diger.mp3"
+    },
+    {
+        "name": "Hürrem",
+        "img": "images/hurrem.png",
+        "sound": "sounds/hurrem.mp3"
+    }
+)
+
+# --- SCENE STORE ---
+
+START_SCENE = "bolum_1"
+
+Option = namedtuple("Option", "key text outcome score_changes next_scene")
+Scene = namedtuple("Scene", "key index description options character")
+
+
+class SceneStore:
+    """Read-only collection of compiled scenes shared by every session"""
+
+    __slots__ = ("scenes", "by_index", "start", "digest")
+
+    def __init__(self, scenes, start=START_SCENE, digest=None):
+        self.by_index = tuple(scenes)
+        self.scenes = MappingProxyType({scene.key: scene for scene in self.by_index})
+        self.start = start
+        self.digest = digest
+
+    def __len__(self):
+        return len(self.by_index)
+
+    def __contains__(self, scene_key):
+        return scene_key in self.scenes
+
+    def get(self, scene_key):
+        """Return the scene for a key, or None if it does not exist"""
+        return self.scenes.get(scene_key)
+
+    def option(self, scene_key, choice_key):
+        """Return one option of a scene, or None if either is unknown"""
+        scene = self.scenes.get(scene_key)
+        if scene is None:
+            return None
+        for option in scene.options:
+            if option.key == choice_key:
+                return option
+        return None
+
+
+def _character(character):
+    return None if character is None else MappingProxyType(dict(character))
+
+
+def compile_scene(index, scene_key, raw_scene):
+    """Turn one nested scene dict into a Scene record"""
+    options = tuple(
+        Option(
+            key,
+            option["text"],
+            option["outcome"],
+            tuple(option["score_changes"].get(score, 0) for score in SCORE_KEYS),
+            option["next_scene"],
+        )
+        for key, option in raw_scene.get("options", {}).items()
+    )
+    return Scene(scene_key, index, raw_scene["description"], options, _character(raw_scene.get("character")))
+
+
+def build_scene_store(raw_scenarios, digest=None):
+    """Compile a scenarios dict into a SceneStore"""
+    return SceneStore(
+        (compile_scene(index, key, raw_scene) for index, (key, raw_scene) in enumerate(raw_scenarios.items())),
+        digest=digest,
+    )
+
+
+def load_raw_scenarios(source=SOURCE_PATH):
+    """Parse the scenario data file into nested dicts"""
+    with open(source, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_scene_store(source=SOURCE_PATH, compiled=COMPILED_PATH):
+    """Return the process-wide scene store, building it on first use
+
+    The precompiled binary form is used when it matches the JSON source;
+    otherwise the JSON is parsed directly.
+    """
+    source_bytes = source.read_bytes() if source.exists() else None
+    if compiled.exists():
+        digest, rows = load_compiled(compiled)
+        if source_bytes is None or digest == source_digest(source_bytes):
+            return SceneStore(
+                (
+                    Scene(key, index, description, tuple(Option(*option) for option in options), _character(character))
+                    for index, (key, description, character, options) in enumerate(rows)
+                ),
+                digest=digest.hex(),
+            )
+    return build_scene_store(json.loads(source_bytes), digest=source_digest(source_bytes).hex())
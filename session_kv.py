@@ -0,0 +1,205 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from engine import GameState
+from scene_format import DATA_DIR
+
+# --- EXTERNAL SESSION STATE ---
+# With OYUN_SESSION_BACKEND set, the per-session fields below live in a
+# versioned key-value store instead of only in this process, so any replica
+# can serve any click and a replica can be drained at will:
+#   memory   in-process dict; a test stand-in, not shared between replicas
+#   sqlite   a SQLite file; shared by replicas that see the same disk
+#   redis    a Redis server at OYUN_REDIS_URL (needs the redis package)
+# Every write names the version it was based on. A write based on an older
+# version raises VersionConflict instead of overwriting, so a click that
+# reaches two replicas is applied once.
+
+SESSION_BACKEND = os.environ.get("OYUN_SESSION_BACKEND", "local")
+SESSION_KV_DB = os.environ.get("OYUN_SESSION_KV_DB", str(DATA_DIR / "session_kv.sqlite3"))
+REDIS_URL = os.environ.get("OYUN_REDIS_URL", "redis://localhost:6379/0")
+SESSION_TTL = int(os.environ.get("OYUN_SESSION_TTL", str(7 * 24 * 3600)))
+
+SYNCED_FIELDS = ("game_data", "audio_played", "current_screen", "selected_character", "character_confirmed")
+
+
+class VersionConflict(RuntimeError):
+    """Raised when a write is based on a version that is no longer current"""
+
+
+class MemoryKV:
+    """Versioned values in a dict"""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (value, version); (None, 0) for a missing key"""
+        with self._lock:
+            data, version = self._values.get(key, (None, 0))
+        return (None if data is None else json.loads(data)), version
+
+    def put(self, key, value, version):
+        """Store value if key is still at version; return the new version"""
+        with self._lock:
+            current = self._values.get(key, (None, 0))[1]
+            if current != version:
+                raise VersionConflict(f"{key} is at version {current}, not {version}")
+            self._values[key] = (json.dumps(value), version + 1)
+        return version + 1
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+
+class SQLiteKV:
+    """Versioned values in a SQLite table; the compare-and-set is one UPDATE"""
+
+    def __init__(self, path=SESSION_KV_DB):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS kv "
+            "(key TEXT PRIMARY KEY, version INTEGER NOT NULL, value TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT value, version FROM kv WHERE key = ?", (key,)).fetchone()
+        return (None, 0) if row is None else (json.loads(row[0]), row[1])
+
+    def put(self, key, value, version):
+        data = json.dumps(value)
+        with self._lock:
+            if version == 0:
+                cursor = self._db.execute(
+                    "INSERT INTO kv (key, version, value, updated) VALUES (?, 1, ?, ?) ON CONFLICT(key) DO NOTHING",
+                    (key, data, time.time()),
+                )
+            else:
+                cursor = self._db.execute(
+                    "UPDATE kv SET version = version + 1, value = ?, updated = ? WHERE key = ? AND version = ?",
+                    (data, time.time(), key, version),
+                )
+        if cursor.rowcount != 1:
+            raise VersionConflict(f"{key} is no longer at version {version}")
+        return version + 1
+
+    def delete(self, key):
+        with self._lock:
+            self._db.execute("DELETE FROM kv WHERE key = ?", (key,))
+
+
+# KEYS[1] = key, ARGV = expected version, value, ttl seconds
+_REDIS_CAS = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'version') or '0')
+if current ~= tonumber(ARGV[1]) then
+    return -1
+end
+redis.call('HSET', KEYS[1], 'version', current + 1, 'value', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return current + 1
+"""
+
+
+class RedisKV:
+    """Versioned values in Redis hashes; the compare-and-set is a Lua script"""
+
+    def __init__(self, url=REDIS_URL, ttl=SESSION_TTL):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("OYUN_SESSION_BACKEND=redis needs the redis package") from None
+        self._client = redis.Redis.from_url(url)
+        self._cas = self._client.register_script(_REDIS_CAS)
+        self.ttl = ttl
+
+    def get(self, key):
+        value, version = self._client.hmget(key, "value", "version")
+        return (None, 0) if version is None else (json.loads(value), int(version))
+
+    def put(self, key, value, version):
+        new_version = self._cas(keys=[key], args=[version, json.dumps(value), self.ttl])
+        if new_version < 0:
+            raise VersionConflict(f"{key} is no longer at version {version}")
+        return new_version
+
+    def delete(self, key):
+        self._client.delete(key)
+
+
+class SessionSync:
+    """Mirror the synced session_state fields to a versioned store
+
+    session_state["session_version"] is the store version the local fields
+    were last read from or written as.
+    """
+
+    def __init__(self, kv):
+        self.kv = kv
+        self.conflicts = 0
+
+    @staticmethod
+    def key(session_state):
+        return f"session:{session_state['session_id']}"
+
+    def exists(self, session_id):
+        """Return True if the store holds state for session_id"""
+        return self.kv.get(f"session:{session_id}")[0] is not None
+
+    @staticmethod
+    def snapshot(session_state):
+        """Return a detached copy of the synced fields as plain JSON data"""
+        snapshot = {field: session_state[field] for field in SYNCED_FIELDS}
+        snapshot["game_data"] = snapshot["game_data"].to_dict()
+        # Round-trip so later in-place edits (audio_played) show up as changes
+        return json.loads(json.dumps(snapshot))
+
+    def pull(self, session_state):
+        """Load newer fields from the store; return True if anything changed"""
+        value, version = self.kv.get(self.key(session_state))
+        if value is None or version <= session_state.get("session_version", 0):
+            return False
+        for field in SYNCED_FIELDS:
+            session_state[field] = GameState.from_dict(value[field]) if field == "game_data" else value[field]
+        session_state["session_version"] = version
+        session_state["session_synced"] = self.snapshot(session_state)
+        return True
+
+    def push(self, session_state):
+        """Write the fields if they changed; raises VersionConflict if stale"""
+        snapshot = self.snapshot(session_state)
+        if snapshot == session_state.get("session_synced"):
+            return session_state.get("session_version", 0)
+        try:
+            version = self.kv.put(self.key(session_state), snapshot, session_state.get("session_version", 0))
+        except VersionConflict:
+            self.conflicts += 1
+            raise
+        session_state["session_version"] = version
+        session_state["session_synced"] = snapshot
+        return version
+
+    def delete(self, session_state):
+        self.kv.delete(self.key(session_state))
+
+
+def make_session_sync(kind=SESSION_BACKEND):
+    """Return a SessionSync for OYUN_SESSION_BACKEND, or None when it is local"""
+    if kind == "local":
+        return None
+    backends = {"memory": MemoryKV, "sqlite": SQLiteKV, "redis": RedisKV}
+    if kind not in backends:
+        raise ValueError(f"Unknown OYUN_SESSION_BACKEND {kind!r}, expected 'local' or one of {', '.join(backends)}")
+    return SessionSync(backends[kind]())
+
+
+# Shared by every session in the process; None keeps state in st.session_state only
+session_sync = make_session_sync()
@@ -0,0 +1,109 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from simulator import DEFAULT_BATCH_SIZE, SceneTables, SimulationResult, compile_tables, play_batch
+
+# --- MULTI-CORE SIMULATION RUNNER ---
+# The scene tables are copied once into shared memory. Each worker process
+# attaches to them in its initializer, so tasks only carry a game count and
+# a seed. Each shard returns its histograms and the parent adds them up.
+
+_SHARED_ARRAYS = ("deltas", "next_index", "option_counts")
+_worker_tables = None
+_worker_policy = None
+_worker_segments = []
+
+
+def _share(array):
+    """Copy an array into a new shared memory block"""
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+    return segment, (segment.name, array.shape, array.dtype.str)
+
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+    segment = shared_memory.SharedMemory(name=name)
+    _worker_segments.append(segment)
+    return np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+
+
+def _init_worker(descriptors, metadata, policy_descriptor):
+    """Attach a worker process to the shared scene tables"""
+    global _worker_tables, _worker_policy
+    arrays = {field: _attach(descriptor) for field, descriptor in descriptors.items()}
+    _worker_tables = SceneTables(**arrays, **metadata)
+    _worker_policy = _attach(policy_descriptor) if policy_descriptor else None
+
+
+def _run_shard(games, seed, batch_size):
+    """Play one shard of games in a worker and return its histograms"""
+    rng = np.random.default_rng(seed)
+    result = SimulationResult(_worker_tables)
+    remaining = games
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        result.add_scores(play_batch(_worker_tables, batch, rng, _worker_policy))
+        remaining -= batch
+    return result
+
+
+def run(games, workers=None, shards=None, seed=None, policy=None, tables=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Run a simulation sharded across a process pool and merge the results"""
+    tables = tables or compile_tables()
+    workers = workers or os.cpu_count() or 1
+    shards = max(1, min(shards or workers * 4, games))
+    shard_games = [games // shards + (i < games % shards) for i in range(shards)]
+    seeds = np.random.SeedSequence(seed).spawn(shards)
+
+    segments = []
+    try:
+        descriptors = {}
+        for field in _SHARED_ARRAYS:
+            segment, descriptors[field] = _share(getattr(tables, field))
+            segments.append(segment)
+        policy_descriptor = None
+        if policy is not None:
+            segment, policy_descriptor = _share(np.ascontiguousarray(policy, dtype=np.float64))
+            segments.append(segment)
+        metadata = {
+            field: value for field, value in tables._asdict().items() if field not in _SHARED_ARRAYS
+        }
+
+        result = SimulationResult(tables)
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(descriptors, metadata, policy_descriptor)) as pool:
+            for shard in pool.map(_run_shard, shard_games, seeds, [batch_size] * shards):
+                result.merge(shard)
+        return result
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def main(argv=None):
+    """Command-line entry point for balancing sweeps"""
+    parser = argparse.ArgumentParser(description="Run a sharded Monte Carlo simulation of the game")
+    parser.add_argument("games", type=int)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shards", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    result = run(args.games, args.workers, args.shards, args.seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"{result.games} games in {elapsed:.2f}s ({result.games / elapsed * 60:,.0f} games/min)")
+    for score, rate in result.winner_rates().items():
+        print(f"  {score:<9} wins {rate:7.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from path_analyzer import topological_order
+from scenes import SCORE_KEYS, load_scene_store
+
+# --- MONTE CARLO SIMULATOR ---
+# The scene graph is compiled into flat tables so that a whole batch of games
+# advances one scene per step with a few NumPy gathers:
+#   deltas[scene, option]      -> (harem, suleyman, divan) score change
+#   next_index[scene, option]  -> index of the next scene
+#   option_counts[scene]       -> number of options (0 for end scenes)
+# End scenes point back to themselves with zero deltas, so finished games
+# simply idle until the longest path in the batch is done.
+
+DEFAULT_BATCH_SIZE = 1_000_000
+
+SceneTables = namedtuple(
+    "SceneTables", "keys deltas next_index option_counts start max_depth score_min score_max"
+)
+
+
+def compile_tables(store=None):
+    """Compile a SceneStore into the NumPy tables used by the simulator"""
+    store = store or load_scene_store()
+    order = topological_order(store)
+    keys = tuple(order)
+    index = {key: i for i, key in enumerate(keys)}
+    max_options = max(len(scene.options) for scene in store.by_index) or 1
+
+    deltas = np.zeros((len(keys), max_options, len(SCORE_KEYS)), dtype=np.int16)
+    next_index = np.tile(np.arange(len(keys), dtype=np.int32)[:, None], (1, max_options))
+    option_counts = np.zeros(len(keys), dtype=np.int32)
+    depth = dict.fromkeys(keys, 0)
+    score_min = dict.fromkeys(keys, (0,) * len(SCORE_KEYS))
+    score_max = dict.fromkeys(keys, (0,) * len(SCORE_KEYS))
+
+    for key in reversed(order):
+        scene = store.get(key)
+        if scene is None or not scene.options:
+            continue
+        i = index[key]
+        option_counts[i] = len(scene.options)
+        lows, highs = [], []
+        for j, option in enumerate(scene.options):
+            deltas[i, j] = option.score_changes
+            next_index[i, j] = index[option.next_scene]
+            lows.append([a + b for a, b in zip(option.score_changes, score_min[option.next_scene])])
+            highs.append([a + b for a, b in zip(option.score_changes, score_max[option.next_scene])])
+        depth[key] = 1 + max(depth[option.next_scene] for option in scene.options)
+        score_min[key] = tuple(map(min, zip(*lows)))
+        score_max[key] = tuple(map(max, zip(*highs)))
+
+    return SceneTables(
+        keys, deltas, next_index, option_counts, index[store.start], depth[store.start],
+        np.array(score_min[store.start], dtype=np.int64), np.array(score_max[store.start], dtype=np.int64),
+    )
+
+
+class SimulationResult:
+    """Mergeable histograms of final scores and winning categories"""
+
+    def __init__(self, tables):
+        self.games = 0
+        self.score_min = tables.score_min
+        width = int((tables.score_max - tables.score_min).max()) + 1
+        self.score_counts = np.zeros((len(SCORE_KEYS), width), dtype=np.int64)
+        self.winner_counts = np.zeros(len(SCORE_KEYS), dtype=np.int64)
+
+    def add_scores(self, scores):
+        """Fold a (games x 3) array of final scores into the histograms"""
+        self.games += len(scores)
+        width = self.score_counts.shape[1]
+        for i in range(len(SCORE_KEYS)):
+            self.score_counts[i] += np.bincount(scores[:, i] - self.score_min[i], minlength=width)
+        # argmax returns the first maximum, matching engine.winner's tie rule
+        self.winner_counts += np.bincount(scores.argmax(axis=1), minlength=len(SCORE_KEYS))
+
+    def merge(self, other):
+        """Add another result computed from the same tables"""
+        self.games += other.games
+        self.score_counts += other.score_counts
+        self.winner_counts += other.winner_counts
+        return self
+
+    def histograms(self):
+        """Return {category: {score: games}} without empty bins"""
+        return {
+            score: {
+                int(value) + int(self.score_min[i]): int(self.score_counts[i, value])
+                for value in np.flatnonzero(self.score_counts[i])
+            }
+            for i, score in enumerate(SCORE_KEYS)
+        }
+
+    def winner_rates(self):
+        """Return the share of games won by each category"""
+        return {score: int(count) / max(self.games, 1) for score, count in zip(SCORE_KEYS, self.winner_counts)}
+
+
+def play_batch(tables, games, rng, policy=None):
+    """Play a batch of games to the end and return their final scores
+
+    policy is None for uniformly random choices, or a (scenes x options)
+    array of choice probabilities indexed like tables.deltas.
+    """
+    scene = np.full(games, tables.start, dtype=np.int32)
+    scores = np.zeros((games, len(SCORE_KEYS)), dtype=np.int32)
+    cumulative = None if policy is None else np.cumsum(policy, axis=1)
+
+    for _ in range(tables.max_depth):
+        if cumulative is None:
+            choice = (rng.random(games) * tables.option_counts[scene]).astype(np.int32)
+        else:
+            # Pick the first option whose cumulative probability exceeds a uniform draw
+            choice = (rng.random((games, 1)) >= cumulative[scene]).sum(axis=1, dtype=np.int32)
+            np.minimum(choice, np.maximum(tables.option_counts[scene] - 1, 0), out=choice)
+        scores += tables.deltas[scene, choice]
+        scene = tables.next_index[scene, choice]
+    return scores
+
+
+def simulate(games, tables=None, policy=None, seed=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Play many games in batches and return a SimulationResult"""
+    tables = tables or compile_tables()
+    rng = np.random.default_rng(seed)
+    result = SimulationResult(tables)
+    remaining = games
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        result.add_scores(play_batch(tables, batch, rng, policy))
+        remaining -= batch
+    return result
+
+
+def main(argv=None):
+    """Run a uniformly random simulation and print winner rates"""
+    argv = sys.argv[1:] if argv is None else argv
+    games = int(argv[0]) if argv else 1_000_000
+    seed = int(argv[1]) if len(argv) > 1 else None
+
+    started = time.perf_counter()
+    result = simulate(games, seed=seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"{result.games} games in {elapsed:.2f}s ({result.games / elapsed * 60:,.0f} games/min)")
+    for score, rate in result.winner_rates().items():
+        print(f"  {score:<9} wins {rate:7.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import asset_server
+from tracing import traced
+
+# --- MOBILE-OPTIMIZED CSS ---
+# The stylesheet lives in static/style.css and is read once per process.
+# In asset url mode pages only carry a <link> to it plus a preload of the
+# self-hosted Papyrus webfont, both cached by the browser across reruns and
+# sessions. Otherwise only the stylesheet is inlined: embedding the font
+# would resend ~70 KB on every full rerun, so inline mode uses an installed
+# Papyrus or the serif fallback from the font stack.
+
+ROOT = Path(__file__).resolve().parent
+STYLESHEET = "static/style.css"
+WEBFONTS = ("fonts/papyrus-subset.woff2", "fonts/papyrus.ttf")
+FONT_FORMATS = {".woff2": "woff2", ".ttf": "truetype"}
+
+css = "<style>\n" + (ROOT / STYLESHEET).read_text(encoding="utf-8") + "</style>\n"
+
+
+def webfont():
+    """Return the smallest bundled build of the game font"""
+    return next((path for path in WEBFONTS if (ROOT / path).exists()), None)
+
+
+# Resolved once; fonts only change with a deploy
+WEBFONT = webfont()
+
+
+def font_face(src, font_format):
+    """Return a <style> block declaring the Papyrus webfont at src"""
+    return (
+        f"<style>@font-face{{font-family:'Papyrus';src:url('{src}') format('{font_format}');"
+        "font-display:swap}</style>"
+    )
+
+
+@traced(payload=len)
+def style_tags():
+    """Return the HTML that applies the game stylesheet"""
+    if not asset_server.url_mode():
+        return css
+    html = f'<link rel="stylesheet" href="{asset_server.asset_url(STYLESHEET)}">'
+    font = WEBFONT
+    if font:
+        font_url = asset_server.asset_url(font)
+        font_format = FONT_FORMATS[Path(font).suffix]
+        html = (
+            f'<link rel="preload" href="{font_url}" as="font" type="font/{font_format}" crossorigin>'
+            + html
+            + font_face(font_url, font_format)
+        )
+    return html
@@ -0,0 +1,62 @@
+import pytest
+
+from engine import GameState, StaleChoice, apply_choice, choice_token, rejected_choices
+from scenes import load_scene_store
+
+
+@pytest.fixture
+def store():
+    return load_scene_store()
+
+
+def first_option(state, store):
+    return store.get(state.current_scene).options[0].key
+
+
+def test_token_for_current_state_applies(store):
+    state = GameState()
+    token = choice_token(state, "s1")
+    apply_choice(state, token.scene, first_option(state, store), store, token=token, session="s1")
+    assert state.moves == 1
+
+
+def test_replayed_token_is_rejected_as_duplicate(store):
+    state = GameState()
+    token = choice_token(state, "s1")
+    choice = first_option(state, store)
+    apply_choice(state, token.scene, choice, store, token=token, session="s1")
+    snapshot = state.to_dict()
+    before = rejected_choices["duplicate"]
+
+    with pytest.raises(StaleChoice, match="duplicate"):
+        apply_choice(state, token.scene, choice, store, token=token, session="s1")
+    assert state.to_dict() == snapshot
+    assert rejected_choices["duplicate"] == before + 1
+
+
+def test_token_from_another_session_is_rejected(store):
+    state = GameState()
+    token = choice_token(state, "other")
+    before = rejected_choices["session"]
+
+    with pytest.raises(StaleChoice, match="session"):
+        apply_choice(state, token.scene, first_option(state, store), store, token=token, session="s1")
+    assert state.moves == 0
+    assert rejected_choices["session"] == before + 1
+
+
+def test_token_for_another_scene_is_rejected_as_stale(store):
+    state = GameState()
+    token = choice_token(state, "s1")._replace(scene="final")
+    before = rejected_choices["stale"]
+
+    with pytest.raises(StaleChoice, match="stale"):
+        apply_choice(state, state.current_scene, first_option(state, store), store, token=token, session="s1")
+    assert state.moves == 0
+    assert rejected_choices["stale"] == before + 1
+
+
+def test_choice_without_token_is_not_checked(store):
+    state = GameState()
+    apply_choice(state, state.current_scene, first_option(state, store), store)
+    assert state.moves == 1
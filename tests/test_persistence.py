@@ -0,0 +1,48 @@
+import threading
+
+from persistence import MemoryBackend, WriteBehind
+
+
+class SlowBackend(MemoryBackend):
+    """Holds save_many open until the test lets it finish"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def save_many(self, items):
+        items = list(items)
+        self.writing.set()
+        self.release.wait(5)
+        super().save_many(items)
+
+
+def test_delete_during_flush_is_not_undone():
+    backend = SlowBackend()
+    store = WriteBehind(backend, interval=0.01)
+    store.save("s1", {"n": 1})
+    writer = threading.Thread(target=store.flush)
+    writer.start()
+    assert backend.writing.wait(5)
+
+    store.delete("s1")
+    assert store.load("s1") is None
+    backend.release.set()
+    writer.join()
+    store.flush()
+
+    assert backend.load("s1") is None
+    assert store.load("s1") is None
+    store.close()
+
+
+def test_save_after_delete_wins():
+    store = WriteBehind(MemoryBackend(), interval=0.01)
+    store.save("s1", {"n": 1})
+    store.flush()
+    store.delete("s1")
+    store.save("s1", {"n": 2})
+    store.flush()
+    assert store.load("s1") == {"n": 2}
+    store.close()
@@ -0,0 +1,74 @@
+import pytest
+
+from engine import GameState
+from session_kv import MemoryKV, SessionSync, SQLiteKV, VersionConflict
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def kv(request, tmp_path):
+    if request.param == "memory":
+        return MemoryKV()
+    return SQLiteKV(str(tmp_path / "kv.sqlite3"))
+
+
+def session_state(session_id="s1"):
+    return {
+        "session_id": session_id,
+        "game_data": GameState(),
+        "audio_played": {"character": False, "start": False, "background": False},
+        "current_screen": "character_select",
+        "selected_character": None,
+        "character_confirmed": False,
+    }
+
+
+def test_missing_key_reads_as_version_zero(kv):
+    assert kv.get("session:none") == (None, 0)
+
+
+def test_put_advances_the_version(kv):
+    assert kv.put("k", {"n": 1}, 0) == 1
+    assert kv.put("k", {"n": 2}, 1) == 2
+    assert kv.get("k") == ({"n": 2}, 2)
+
+
+def test_put_with_stale_version_conflicts(kv):
+    kv.put("k", {"n": 1}, 0)
+    kv.put("k", {"n": 2}, 1)
+    with pytest.raises(VersionConflict):
+        kv.put("k", {"n": 3}, 1)
+    assert kv.get("k") == ({"n": 2}, 2)
+
+
+def test_second_create_conflicts(kv):
+    kv.put("k", {"n": 1}, 0)
+    with pytest.raises(VersionConflict):
+        kv.put("k", {"n": 2}, 0)
+    assert kv.get("k") == ({"n": 1}, 1)
+
+
+def test_delete_resets_the_key(kv):
+    kv.put("k", {"n": 1}, 0)
+    kv.delete("k")
+    assert kv.get("k") == (None, 0)
+
+
+def test_click_reaching_two_replicas_is_applied_once(kv):
+    sync = SessionSync(kv)
+    first = session_state()
+    sync.push(first)
+    second = session_state()
+    assert sync.exists("s1")
+    assert sync.pull(second)
+
+    # Both replicas apply the same click from the same version
+    for state in (first, second):
+        state["current_screen"] = "game"
+    sync.push(first)
+    with pytest.raises(VersionConflict):
+        sync.push(second)
+    assert sync.conflicts == 1
+
+    # The loser catches up instead of overwriting
+    assert sync.pull(second)
+    assert second["session_version"] == first["session_version"]
@@ -0,0 +1,226 @@
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- TRACING ---
+# @traced() wraps a function and records its wall time, call count and,
+# with payload=, the size of what it returned into process-wide histograms.
+# With emitted=True it also records the bytes of HTML sent through
+# counted() functions (st.markdown) while it runs, so a screen is billed
+# for everything it writes to the page, nested calls included.
+# With OYUN_TRACING unset both decorators hand back the function itself,
+# so tracing costs nothing when it is off.
+#
+# Export, both optional:
+#   OYUN_METRICS_PORT   Prometheus text format at http://host:port/metrics
+#   OYUN_METRICS_FILE   the same text rewritten every OYUN_METRICS_INTERVAL s
+
+TRACING = os.environ.get("OYUN_TRACING", "0") == "1"
+METRICS_HOST = os.environ.get("OYUN_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("OYUN_METRICS_PORT", "0"))
+METRICS_FILE = os.environ.get("OYUN_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("OYUN_METRICS_INTERVAL", "15"))
+
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BYTES_BUCKETS = tuple(256 * 4 ** i for i in range(9))  # 256 B .. 16 MiB
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class Registry:
+    """Named histograms, one series per traced function"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, metric, help_text, buckets, label):
+        key = (metric, label)
+        with self._lock:
+            histogram = self._metrics.get(key)
+            if histogram is None:
+                histogram = self._metrics[key] = (help_text, Histogram(buckets))
+        return histogram[1]
+
+    def prometheus_text(self):
+        """Return every histogram in the Prometheus text exposition format"""
+        with self._lock:
+            items = sorted(self._metrics.items())
+        lines = []
+        seen = set()
+        for (metric, label), (help_text, histogram) in items:
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+            counts, total, count = histogram.snapshot()
+            running = 0
+            for bound, bucket in zip(histogram.buckets, counts):
+                running += bucket
+                lines.append(f'{metric}_bucket{{fn="{label}",le="{bound:g}"}} {running}')
+            lines.append(f'{metric}_bucket{{fn="{label}",le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{fn="{label}"}} {total:.6f}')
+            lines.append(f'{metric}_count{{fn="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def _durations(name):
+    return registry.histogram("oyun_call_duration_seconds", "Wall time of traced calls", DURATION_BUCKETS, name)
+
+
+def _payloads(name):
+    return registry.histogram("oyun_payload_bytes", "Size of what traced calls returned", BYTES_BUCKETS, name)
+
+
+def _emitted(name):
+    return registry.histogram("oyun_emitted_bytes", "HTML bytes written while traced calls ran", BYTES_BUCKETS, name)
+
+
+# Per-thread stack of byte totals, one per emitted=True call in progress
+_open = threading.local()
+
+
+def traced(name=None, payload=None, emitted=False):
+    """Decorator recording duration and call count; payload(result) gives bytes"""
+    def decorate(fn):
+        if not TRACING:
+            return fn
+        label = name or fn.__name__
+        durations = _durations(label)
+        payloads = _payloads(label) if payload else None
+        emits = _emitted(label) if emitted else None
+        ensure_exporter()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if emits is not None:
+                totals = _open.__dict__.setdefault("totals", [])
+                totals.append(0)
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                # st.rerun() leaves by exception; the time still counts
+                durations.observe(time.perf_counter() - started)
+                if emits is not None:
+                    emits.observe(totals.pop())
+            if payloads is not None and result is not None:
+                payloads.observe(payload(result))
+            return result
+        return wrapper
+    return decorate
+
+
+def counted(fn):
+    """Wrap an HTML writer so its first argument counts toward open traced calls"""
+    if not TRACING:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(body, *args, **kwargs):
+        totals = getattr(_open, "totals", None)
+        if totals:
+            size = len(body.encode("utf-8"))
+            for i in range(len(totals)):
+                totals[i] += size
+        return fn(body, *args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def span(name):
+    """Record the duration of a block under name"""
+    if not TRACING:
+        yield
+        return
+    ensure_exporter()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _durations(name).observe(time.perf_counter() - started)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the registry at /metrics"""
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def dump_metrics(path=METRICS_FILE):
+    """Write the registry to path atomically"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(registry.prometheus_text())
+    os.replace(tmp, path)
+
+
+def _dump_loop():
+    while True:
+        time.sleep(METRICS_INTERVAL)
+        try:
+            dump_metrics()
+        except OSError as exc:
+            print(f"tracing: metrics dump failed: {exc}", file=sys.stderr)
+
+
+_exporter_started = False
+_exporter_lock = threading.Lock()
+
+
+def ensure_exporter():
+    """Start the configured exporters once per process"""
+    global _exporter_started
+    if _exporter_started:
+        return
+    with _exporter_lock:
+        if _exporter_started:
+            return
+        _exporter_started = True
+        if METRICS_PORT:
+            server = ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), MetricsHandler)
+            threading.Thread(target=server.serve_forever, name="oyun-metrics", daemon=True).start()
+        if METRICS_FILE:
+            threading.Thread(target=_dump_loop, name="oyun-metrics-dump", daemon=True).start()
+            atexit.register(dump_metrics)